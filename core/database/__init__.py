@@ -7,6 +7,7 @@ Exports database operation functions and collection references.
 from .events.get_events import get_events
 from .sessions.get_sessions import get_sessions
 from .sessions.get_session import get_session
+from .sessions.get_last_session import get_last_session
 from .stints.get_stints import get_stints
 from .strategies.get_strategies import get_strategies
 from .events.get_event import get_event
@@ -24,7 +25,6 @@ from .sessions.create_session import create_session
 from .strategies.create_strategy import create_strategy
 from .stints.upsert_official_stint import upsert_official_stint
 from .stints.delete_stint import delete_stint
-from .events.delete_strategy import delete_strategy
 # agent registry operations
 from .agents.register_agent import register_agent
 from .agents.update_agent_heartbeat import update_agent_heartbeat
@@ -47,6 +47,7 @@ __all__ = [
     'get_events',
     'get_sessions',
     'get_session',
+    'get_last_session',
     'get_stints',
     'get_strategies',
     'get_event',
@@ -56,6 +57,7 @@ __all__ = [
     'set_tires_remaining_at_green_flag',
     'update_strategy',
     'update_stint',
+    'get_latest_stint',
     'update_team_drivers',
     'create_event',
     'create_session',
@@ -72,6 +74,7 @@ __all__ = [
     'test_connection',
     'register_agent',
     'update_agent_heartbeat',
+    'clean_stale_agents',
     'get_agents',
     'delete_agent',
     'close_connection',
@@ -10,7 +10,7 @@ from core.errors import log, log_exception
 from ..connection import get_events_collection
 
 
-def get_events(sort_by: str = 'name', ascending: bool = False) -> list[dict]:
+def get_events(sort_by: str = 'name', ascending: bool = False, projection: dict = None) -> list[dict]:
     """
     Retrieve all events from the database.
     
@@ -19,6 +19,8 @@ def get_events(sort_by: str = 'name', ascending: bool = False) -> list[dict]:
                  Defaults to 'name' for alphabetical order.
         ascending: Sort order - True for ascending, False for descending.
                    Defaults to False (most recent first).
+        projection: Optional MongoDB projection limiting the returned fields
+                    (e.g. {'name': 1} for pickers). Defaults to full documents.
     
     Returns:
         List of event documents. Each document contains:
@@ -38,7 +40,7 @@ def get_events(sort_by: str = 'name', ascending: bool = False) -> list[dict]:
         events_col = get_events_collection()
         
         # Build query with optional sorting
-        query = events_col.find()
+        query = events_col.find({}, projection)
         
         if sort_by:
             sort_direction = 1 if ascending else -1
@@ -0,0 +1,49 @@
+"""
+Retrieve the last session of an event from the database.
+
+Query function for callers that only need one session and would otherwise
+materialize the full ``get_sessions`` list to take its final element.
+"""
+
+from bson.objectid import ObjectId
+
+from ..connection import get_sessions_collection
+from core.errors import log
+
+
+def get_last_session(event_id: str, sort_by: str = "name") -> dict | None:
+    """
+    Retrieve the session that sorts last for an event.
+
+    Args:
+        event_id: String representation of the event ObjectId
+        sort_by: Field to order by; matches ``get_sessions`` ordering.
+                 Defaults to "name".
+
+    Returns:
+        The session document that would be last in ``get_sessions(event_id)``
+        None if the event has no sessions or on error
+
+    Raises:
+        ValueError: If event_id is invalid
+    """
+    if not event_id:
+        raise ValueError("event_id is required")
+
+    try:
+        event_obj_id = ObjectId(event_id)
+
+        # Sort descending and fetch one document instead of the whole cursor
+        sessions_col = get_sessions_collection()
+        session = sessions_col.find_one({"race_id": event_obj_id}, sort=[(sort_by, -1)])
+
+        if session:
+            log('DEBUG', f'Retrieved last session: {session.get("name")}',
+                category='database', action='get_last_session')
+
+        return session
+
+    except Exception as e:
+        log('ERROR', f'Failed to retrieve last session for event {event_id}: {e}',
+            category='database', action='get_last_session')
+        return None
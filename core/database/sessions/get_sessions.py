@@ -11,7 +11,7 @@ from core.errors import log, log_exception
 from ..connection import get_sessions_collection
 
 
-def get_sessions(event_id: str, sort_by: str = "name", ascending: bool = True) -> list[dict]:
+def get_sessions(event_id: str, sort_by: str = "name", ascending: bool = True, projection: dict = None) -> list[dict]:
     """
     Retrieve all sessions for a specific event.
     
@@ -21,6 +21,8 @@ def get_sessions(event_id: str, sort_by: str = "name", ascending: bool = True) -
                  Defaults to "name".
         ascending: Sort order - True for ascending, False for descending.
                    Defaults to True.
+        projection: Optional MongoDB projection limiting the returned fields
+                    (e.g. {"name": 1} for pickers). Defaults to full documents.
     
     Returns:
         List of session documents for the event. Each document contains:
@@ -46,7 +48,7 @@ def get_sessions(event_id: str, sort_by: str = "name", ascending: bool = True) -
         sessions_col = get_sessions_collection()
         
         # Build query with optional sorting
-        query = sessions_col.find({"race_id": event_object_id})
+        query = sessions_col.find({"race_id": event_object_id}, projection)
         
         if sort_by:
             sort_direction = 1 if ascending else -1
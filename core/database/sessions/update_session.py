@@ -9,7 +9,6 @@ from pymongo.errors import PyMongoError
 
 from ..connection import get_sessions_collection
 from core.errors import log
-from .set_tires_remaining_at_green_flag import set_tires_remaining_at_green_flag
 
 
 def update_session(session_id: str, name: str = None, tires_remaining_at_green_flag: int = None) -> bool:
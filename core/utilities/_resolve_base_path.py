@@ -0,0 +1,19 @@
+"""
+Determine the base directory for resource paths.
+"""
+
+import os
+import sys
+
+
+def _resolve_base_path():
+    """
+    Determine the directory that resource paths are relative to.
+    
+    Returns:
+        str: sys._MEIPASS when bundled, otherwise the absolute working directory
+    """
+    try:
+        return sys._MEIPASS
+    except Exception:
+        return os.path.abspath(".")
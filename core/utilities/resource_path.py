@@ -6,9 +6,16 @@ sys._MEIPASS when bundled, or the current working directory for development.
 """
 
 import os
-import sys
+from functools import lru_cache
 
+from ._resolve_base_path import _resolve_base_path
 
+# Resolved once at import; the bundle root and launch directory never change
+# during a run, so there is no need to query them on every lookup.
+_BASE_PATH = _resolve_base_path()
+
+
+@lru_cache(maxsize=None)
 def resource_path(relative_path):
     """
     Get the absolute path to a resource file.
@@ -21,11 +28,7 @@ def resource_path(relative_path):
         
     This function handles both PyInstaller bundled applications (which have
     sys._MEIPASS set) and development environments (where it falls back to
-    the current working directory).
+    the current working directory). Results are memoized because the same
+    handful of icons and stylesheets are resolved every time widgets rebuild.
     """
-    try:
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
-
-    return os.path.join(base_path, relative_path)
+    return os.path.join(_BASE_PATH, relative_path)
@@ -13,7 +13,6 @@ from PyQt6.QtGui import QIcon
 from PyQt6.QtCore import QSize
 
 from ui.components.window import ApplicationWindow
-from ui.components import SettingsView
 from ui.utilities import FONT, get_fonts
 from core.utilities import resource_path
 from core.errors import log, log_exception
@@ -1,31 +1,42 @@
 """
 Barrel file for UI components.
 
-Provides access to all UI components organized by category.
+Provides access to all UI components organized by category. Exports are
+resolved lazily (PEP 562) so importing one component package does not
+import every view in the application.
 """
 
-from .common import ClickableWidget, UpwardComboBox, DraggableArea
-from .window import ApplicationWindow, WindowButtons
-from .navigation import NavigationMenu, SessionPicker, MenuItemConfig, create_menu_item, update_menu_item_state
-from .stint_tracking import TrackerView
-from .settings import SettingsView
+from importlib import import_module
 
-__all__ = [
+_LAZY_EXPORTS = {
     # Common components
-    'ClickableWidget',
-    'UpwardComboBox',
-    'DraggableArea',
+    'ClickableWidget': '.common',
+    'UpwardComboBox': '.common',
+    'DraggableArea': '.common',
     # Window components
-    'ApplicationWindow',
-    'WindowButtons',
+    'ApplicationWindow': '.window',
+    'WindowButtons': '.window',
     # Navigation components
-    'NavigationMenu',
-    'SessionPicker',
-    'MenuItemConfig',
-    'create_menu_item',
-    'update_menu_item_state',
+    'NavigationMenu': '.navigation',
+    'SessionPicker': '.navigation',
+    'MenuItemConfig': '.navigation',
+    'create_menu_item': '.navigation',
+    'update_menu_item_state': '.navigation',
     # Stint tracking views
-    'TrackerView',
+    'TrackerView': '.stint_tracking',
     # Settings views
-    'SettingsView'
-]
+    'SettingsView': '.settings',
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Import an exported name on first access and cache it on the package."""
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
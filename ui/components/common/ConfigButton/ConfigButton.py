@@ -11,7 +11,7 @@ from PyQt6.QtWidgets import QPushButton, QSizePolicy
 from PyQt6.QtGui import QIcon
 
 from ui.utilities import FONT, get_fonts
-from ui.utilities.load_icon import load_icon
+from ui.utilities.icon_cache import get_cached_icon
 from ui.utilities.load_style import load_style
 
 class ConfigButton(QPushButton):
@@ -55,6 +55,6 @@ class ConfigButton(QPushButton):
             self.setSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Fixed)
 
         if icon_path:
-            icon = load_icon(icon_path, size=icon_size, color=icon_color)
+            icon = get_cached_icon(icon_path, icon_size, icon_color)
             if icon:
                 self.setIcon(QIcon(icon))
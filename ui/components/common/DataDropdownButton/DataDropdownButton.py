@@ -10,6 +10,7 @@ from PyQt6.QtWidgets import QVBoxLayout, QWidget
 from ui.components.common import DropdownButton
 from .bounded_functions import (
     addItem,
+    addItems,
     blockSignals,
     clear,
     count,
@@ -37,6 +38,7 @@ class DataDropdownButton(QWidget):
     currentIndexChanged = pyqtSignal(int)
 
     addItem = addItem
+    addItems = addItems
     clear = clear
     count = count
     currentData = currentData
@@ -62,6 +64,7 @@ class DataDropdownButton(QWidget):
     ):
         super().__init__(parent)
         self._items: list[tuple[str, str | None]] = []
+        self._data_index: dict[str, int] = {}
         self._current_index = -1
         self._signals_blocked = False
         self._sort_items = sort_items
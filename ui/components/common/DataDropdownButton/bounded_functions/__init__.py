@@ -1,4 +1,5 @@
 from .addItem import addItem
+from .addItems import addItems
 from .blockSignals import blockSignals
 from .clear import clear
 from .count import count
@@ -12,6 +13,7 @@ from .setFixedHeight import setFixedHeight
 
 __all__ = [
   'addItem',
+  'addItems',
   'clear',
   'count',
   'currentData',
@@ -0,0 +1,7 @@
+def addItems(self, items) -> None:
+    """Add several (text, userData) items with a single sort and popup rebuild."""
+    self._items.extend(items)
+    self._refresh_items(emit=False)
+
+    if self._current_index == -1 and self._items:
+        self.setCurrentIndex(0)
@@ -1,6 +1,4 @@
 def findData(self, value) -> int:
     """Find index by user data value."""
-    for index, (_, data) in enumerate(self._items):
-        if data == value or str(data) == str(value):
-            return index
-    return -1
\ No newline at end of file
+    # Served from the reverse index rebuilt in _refresh_items
+    return self._data_index.get(value if isinstance(value, str) else str(value), -1)
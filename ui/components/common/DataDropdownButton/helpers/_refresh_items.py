@@ -3,6 +3,12 @@ def _refresh_items(self, emit: bool = True) -> None:
     if self._sort_items:
         self._items.sort(key=lambda tup: str(tup[0]).lower())
     labels = [label for label, _ in self._items]
+
+    # Reverse index for findData; the first item wins on duplicate data
+    self._data_index = {}
+    for index, (_, data) in enumerate(self._items):
+        self._data_index.setdefault(str(data), index)
+
     self.dropdown.set_items(labels)
 
     if self._current_index >= len(self._items):
@@ -40,6 +40,8 @@ class DraggableArea(QWidget):
         super().__init__(parent)
         self._initial_pos: QPoint = None
         self._was_maximized: bool = False
+        self._window: QWidget = None
+        self._drag_offset: QPoint = None
 
         # Make the widget invisible but still capture mouse events
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
@@ -9,7 +9,10 @@ def mousePressEvent(self, event: QMouseEvent) -> None:
     """Capture initial drag position when left mouse button is pressed."""
     if event.button() == Qt.MouseButton.LeftButton:
         self._initial_pos = event.position().toPoint()
-        self._was_maximized = self.window().isMaximized()
+        # Resolve the window once per drag instead of on every move event
+        self._window = self.window()
+        self._was_maximized = self._window.isMaximized()
+        self._drag_offset = self._window.pos() - event.globalPosition().toPoint()
 
     QWidget.mousePressEvent(self, event)
     event.accept()
@@ -8,6 +8,8 @@ def mouseReleaseEvent(self, event: QMouseEvent) -> None:
     """Reset drag tracking when the mouse button is released."""
     self._initial_pos = None
     self._was_maximized = False
+    self._window = None
+    self._drag_offset = None
 
     QWidget.mouseReleaseEvent(self, event)
     event.accept()
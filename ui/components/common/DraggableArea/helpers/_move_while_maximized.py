@@ -8,7 +8,7 @@ def _move_while_maximized(self, event: QMouseEvent) -> None:
     """Restore a maximized window and position it under the cursor for drag."""
     global_pos = event.globalPosition().toPoint()
 
-    window = self.window()
+    window = self._window
     window.showNormal()
 
     window_width = window.width()
@@ -20,4 +20,5 @@ def _move_while_maximized(self, event: QMouseEvent) -> None:
     window.move(new_x, new_y)
 
     self._initial_pos = QPoint(offset_x, self._initial_pos.y())
+    self._drag_offset = QPoint(new_x, new_y) - global_pos
     self._was_maximized = False
@@ -4,10 +4,5 @@ from PyQt6.QtGui import QMouseEvent
 
 
 def _move_while_normal(self, event: QMouseEvent) -> None:
-    """Move the window using cursor delta from the initial click position."""
-    delta = event.position().toPoint() - self._initial_pos
-    window = self.window()
-    window.move(
-        window.x() + delta.x(),
-        window.y() + delta.y(),
-    )
+    """Move the window so it keeps its offset from the cursor captured on press."""
+    self._window.move(event.globalPosition().toPoint() + self._drag_offset)
@@ -2,12 +2,20 @@
 
 from PyQt6.QtGui import QFontMetrics
 
+# Space prefix per (font key, gap); every dropdown shares a handful of fonts
+_prefix_cache: dict[tuple[str, int], str] = {}
+
 
 def _pad_text(self, text: str, gap: int = 1) -> str:
     """Return text prefixed with spaces to achieve a pixel gap."""
     if not text:
         return text
-    fm = QFontMetrics(self.btn.font())
-    space_width = fm.boundingRect(' ').width() or 1
-    count = (gap + space_width - 1) // space_width
-    return ' ' * count + text
+    font = self.btn.font()
+    key = (font.key(), gap)
+    prefix = _prefix_cache.get(key)
+    if prefix is None:
+        fm = QFontMetrics(font)
+        space_width = fm.boundingRect(' ').width() or 1
+        count = (gap + space_width - 1) // space_width
+        prefix = _prefix_cache[key] = ' ' * count
+    return prefix + text
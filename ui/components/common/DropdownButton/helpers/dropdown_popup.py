@@ -31,6 +31,8 @@ class DropdownPopup(QWidget):
 
         self.buttons = []
         max_text_width = 0
+        # Fresh item buttons share one font, so measure with one metrics object
+        metrics = None
 
         for entry in items:
             display = entry.get('display', '')
@@ -57,7 +59,8 @@ class DropdownPopup(QWidget):
             layout.addWidget(btn)
             self.buttons.append(btn)
 
-            metrics = QFontMetrics(btn.font())
+            if metrics is None:
+                metrics = QFontMetrics(btn.font())
             text_width = metrics.boundingRect(btn.text()).width()
             if text_width > max_text_width:
                 max_text_width = text_width
@@ -1,10 +1,10 @@
 """Set the popup icon and color."""
 
-from ui.utilities.load_icon import load_icon
+from ui.utilities.icon_cache import get_cached_icon
 
 
 def _set_icon(self, popup_type: str) -> None:
     """Set the icon pixmap and color based on the popup type."""
     icon_path, color = self._icon_map.get(popup_type, ("resources/icons/popup/info.svg", "#3b82f6"))
-    icon_pixmap = load_icon(icon_path, size=32, color=color)
+    icon_pixmap = get_cached_icon(icon_path, 32, color)
     self.icon_label.setPixmap(icon_pixmap)
@@ -4,7 +4,7 @@ Section header widget with optional icon and title.
 
 from PyQt6.QtWidgets import QLabel, QHBoxLayout, QWidget
 from ui.utilities.fonts import FONT, get_fonts
-from ui.utilities.load_icon import load_icon
+from ui.utilities.icon_cache import get_cached_icon
 
 
 class SectionHeader(QWidget):
@@ -33,7 +33,7 @@ class SectionHeader(QWidget):
         if icon_path:
             icon_label = QLabel()
             try:
-                icon = load_icon(icon_path, size=icon_size, color=icon_color)
+                icon = get_cached_icon(icon_path, icon_size, icon_color)
             except Exception:
                 icon = None
 
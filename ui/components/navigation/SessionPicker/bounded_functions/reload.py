@@ -1,13 +1,23 @@
 """Reload events and sessions combo boxes."""
 
 
-def reload(self, selected_event_id: str = None, selected_session_id: str = None) -> None:
-	"""Refresh events and sessions combo boxes."""
+def reload(
+	self,
+	selected_event_id: str = None,
+	selected_session_id: str = None,
+	events: list[dict] = None,
+	sessions: list[dict] = None,
+) -> None:
+	"""Refresh events and sessions combo boxes.
+
+	Pre-fetched ``events`` and ``sessions`` docs skip the database queries;
+	``sessions`` are assumed to belong to the first event in ``events``.
+	"""
 	self.events.blockSignals(True)
 	self.sessions.blockSignals(True)
 
 	self.events.clear()
-	self._load_events()
+	self._load_events(events)
 
 	target_event_id = selected_event_id
 	if not target_event_id and self.selection_model and self.selection_model.event_id:
@@ -21,7 +31,10 @@ def reload(self, selected_event_id: str = None, selected_session_id: str = None)
 	event_id = self.events.currentData()
 	self.sessions.clear()
 	if event_id:
-		self._populate_sessions(event_id)
+		prefetched_sessions = None
+		if events and sessions is not None and event_id == str(events[0].get("_id", "")):
+			prefetched_sessions = sessions
+		self._populate_sessions(event_id, prefetched_sessions)
 
 	target_session_id = selected_session_id
 	if not target_session_id and self.selection_model and self.selection_model.session_id:
@@ -33,8 +46,9 @@ def reload(self, selected_event_id: str = None, selected_session_id: str = None)
 			self.sessions.setCurrentIndex(index)
 
 	if self.selection_model:
-		self.selection_model.set_event(self.events.currentData(), self.events.currentText())
-		self.selection_model.set_session(self.sessions.currentData(), self.sessions.currentText())
+		with self.selection_model.batch():
+			self.selection_model.set_event(self.events.currentData(), self.events.currentText())
+			self.selection_model.set_session(self.sessions.currentData(), self.sessions.currentText())
 
 	self.sessions.blockSignals(False)
 	self.events.blockSignals(False)
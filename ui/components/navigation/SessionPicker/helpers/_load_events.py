@@ -6,12 +6,12 @@ from core.database import get_events
 from core.errors import log, log_exception
 
 
-def _load_events(self) -> None:
-    """Clear and load all events into the events combo box."""
+def _load_events(self, events: list[dict] = None) -> None:
+    """Load events into the events combo box, querying only if none are given."""
     try:
-        events = get_events(sort_by=None)
-        for doc in events:
-            self.events.addItem(doc["name"], userData=str(doc["_id"]))
+        if events is None:
+            events = get_events(sort_by=None, projection={"name": 1})
+        self.events.addItems([(doc["name"], str(doc["_id"])) for doc in events])
         log('DEBUG', f'Loaded {len(events)} events into combo box', category='ui', action='load_events')
     except PyMongoError as exc:
         log_exception(exc, 'Failed to load events from database', category='ui', action='load_events')
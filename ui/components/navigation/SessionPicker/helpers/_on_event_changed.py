@@ -16,15 +16,17 @@ def _on_event_changed(self) -> None:
             self.events.blockSignals(events_was_blocked)
         return
 
-    if self.selection_model:
-        self.selection_model.set_event(event_id, event_name)
-
     self._populate_sessions(event_id)
 
-    if self.sessions.count() > 0 and self.selection_model:
-        self.selection_model.set_session(
-            self.sessions.currentData(),
-            self.sessions.currentText(),
-        )
-    elif self.selection_model:
-        self.selection_model.set_session(None)
+    if not self.selection_model:
+        return
+
+    with self.selection_model.batch():
+        self.selection_model.set_event(event_id, event_name)
+        if self.sessions.count() > 0:
+            self.selection_model.set_session(
+                self.sessions.currentData(),
+                self.sessions.currentText(),
+            )
+        else:
+            self.selection_model.set_session(None)
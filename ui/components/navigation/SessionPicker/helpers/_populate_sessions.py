@@ -6,8 +6,8 @@ from core.database import get_sessions
 from core.errors import log, log_exception
 
 
-def _populate_sessions(self, event_id: str = None) -> None:
-    """Populate sessions for the provided event id."""
+def _populate_sessions(self, event_id: str = None, sessions: list[dict] = None) -> None:
+    """Populate sessions for the provided event id, querying only if none are given."""
     self.sessions.blockSignals(True)
     self.sessions.clear()
 
@@ -16,9 +16,9 @@ def _populate_sessions(self, event_id: str = None) -> None:
         return
 
     try:
-        sessions = get_sessions(event_id, sort_by=None)
-        for doc in sessions:
-            self.sessions.addItem(doc["name"], userData=str(doc["_id"]))
+        if sessions is None:
+            sessions = get_sessions(event_id, sort_by=None, projection={"name": 1})
+        self.sessions.addItems([(doc["name"], str(doc["_id"])) for doc in sessions])
         log('DEBUG', f'Loaded {len(sessions)} sessions for event {event_id}', category='ui', action='populate_sessions')
     except ValueError as exc:
         log_exception(exc, f'Invalid event ID: {event_id}', category='ui', action='populate_sessions')
@@ -34,22 +34,29 @@ def handle_stint_tracker_output(
         if message:
             log("INFO", message, category="stint_tracker", action="process_output")
 
+        # Lower-case the chunk at most once; most chunks carry no marker at all
+        lowered = None
+
         if ": [stint_tracker:" in stdout:
-            if "[stint_tracker:create_stint]" in stdout and any(marker in stdout for marker in ("Created stint", "Deduped stint")):
+            if "[stint_tracker:create_stint]" in stdout and ("Created stint" in stdout or "Deduped stint" in stdout):
                 if on_stint_created:
                     on_stint_created()
-            elif "[stint_tracker:track_session]" in stdout and "return to garage" in stdout.lower():
-                if on_return_to_garage:
-                    on_return_to_garage()
-            elif "[stint_tracker:track_session]" in stdout and "in garage" in stdout.lower():
-                if on_player_in_garage:
-                    on_player_in_garage()
+            elif "[stint_tracker:track_session]" in stdout:
+                lowered = stdout.lower()
+                if "return to garage" in lowered:
+                    if on_return_to_garage:
+                        on_return_to_garage()
+                elif "in garage" in lowered:
+                    if on_player_in_garage:
+                        on_player_in_garage()
 
         if ": [database:" in stdout:
-            if "[database:register_agent]" in stdout and "agent already exists" in stdout.lower():
+            if lowered is None:
+                lowered = stdout.lower()
+            if "[database:register_agent]" in stdout and "agent already exists" in lowered:
                 if on_registration_conflict:
                     on_registration_conflict()
-            if "[database:set_tires_remaining_at_green_flag]" in stdout and "set tires remaining at green flag" in stdout.lower():
+            if "[database:set_tires_remaining_at_green_flag]" in stdout and "set tires remaining at green flag" in lowered:
                 # Reuse on_stint_created callback to trigger UI update after setting tires_remaining_at_green_flag
                 if on_stint_created:
                     on_stint_created()
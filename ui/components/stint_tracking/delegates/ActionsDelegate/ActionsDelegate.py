@@ -1,12 +1,9 @@
 """Delegate providing action buttons for completed stints."""
 
-from PyQt6.QtCore import Qt, QRect, pyqtSignal
+from PyQt6.QtCore import pyqtSignal
 from PyQt6.QtGui import QColor
 from PyQt6.QtWidgets import QStyledItemDelegate
 
-from ui.models.TableRoles import TableRoles
-from ui.models.table_constants import ColumnIndex
-
 from .helpers import (
     _button_rects,
     _draw_button,
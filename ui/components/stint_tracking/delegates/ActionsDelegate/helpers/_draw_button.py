@@ -1,9 +1,8 @@
 """Draw a pill-style button with optional icon or text."""
 
 from PyQt6.QtCore import Qt, QRect
-from PyQt6.QtGui import QColor
 
-from ui.utilities.load_icon import load_icon
+from ui.utilities.icon_cache import get_cached_icon
 
 
 def _draw_button(self, painter, style, rect: QRect, svg_name: str | None = None, text: str = "", excluded: bool = False) -> None:
@@ -16,7 +15,7 @@ def _draw_button(self, painter, style, rect: QRect, svg_name: str | None = None,
         icon_x = rect.left() + (rect.width() - icon_size) // 2
         icon_y = rect.top() + (rect.height() - icon_size) // 2
 
-        pix = load_icon(svg_name, size=icon_size, color=self.text_color.name())
+        pix = get_cached_icon(svg_name, icon_size, self.text_color.name())
         if not pix.isNull():
             painter.drawPixmap(int(icon_x), int(icon_y), pix)
             return
@@ -2,11 +2,13 @@
 
 from PyQt6.QtCore import Qt
 
+# Bound once; paint runs for every visible cell on every repaint
+_BACKGROUND_ROLE = Qt.ItemDataRole.BackgroundRole
+
 
 def _paint(self, painter, option, index):
-    bg = index.data(Qt.ItemDataRole.BackgroundRole)
+    bg = index.data(_BACKGROUND_ROLE)
     if bg:
-        painter.save()
+        # fillRect leaves the painter state untouched, so no save/restore
         painter.fillRect(option.rect, bg)
-        painter.restore()
     super(type(self), self).paint(painter, option, index)
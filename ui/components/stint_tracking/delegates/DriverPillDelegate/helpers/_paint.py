@@ -2,7 +2,7 @@
 
 from PyQt6.QtCore import Qt, QRect
 from PyQt6.QtGui import QPen
-from PyQt6.QtWidgets import QStyleOptionViewItem, QStyledItemDelegate
+from PyQt6.QtWidgets import QStyleOptionViewItem
 
 from ui.components.stint_tracking.delegates.delegate_utils import paint_model_background
 
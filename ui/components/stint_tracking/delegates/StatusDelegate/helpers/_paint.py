@@ -4,7 +4,7 @@ from PyQt6.QtCore import Qt, QRect
 from PyQt6.QtGui import QColor
 
 from ui.components.stint_tracking.delegates.delegate_utils import paint_model_background
-from ui.utilities.load_icon import load_icon
+from ui.utilities.icon_cache import get_cached_icon
 from core.utilities import resource_path
 
 
@@ -28,7 +28,7 @@ def _paint(self, painter, option, index):
         icon_filename, color_hex = status_config
         icon_path = resource_path(f"resources/icons/table_cells/{icon_filename}")
         text_color = QColor(color_hex)
-        icon_pixmap = load_icon(icon_path, color=text_color.name(), size=self.icon_size)
+        icon_pixmap = get_cached_icon(icon_path, self.icon_size, text_color.name())
     else:
         icon_pixmap = None
         text_color = self.default_color
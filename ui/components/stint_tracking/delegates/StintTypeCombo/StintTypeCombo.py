@@ -2,6 +2,8 @@
 
 from PyQt6.QtWidgets import QStyledItemDelegate
 
+from ui.models.table_constants import STINT_TYPE_NAMES
+
 from .helpers import (
     _find_view,
     create_editor,
@@ -26,8 +28,5 @@ class StintTypeCombo(QStyledItemDelegate):
         super().__init__(parent)
         self.update_doc = update_doc
         self.strategy_id = strategy_id
-        self.items = [
-            "", "Single", "Double", "Triple", "Quadruple", "Quintuple",
-            "Sextuple", "Septuple", "Octuple", "Nonuple", "Decuple",
-        ]
+        self.items = ["", *STINT_TYPE_NAMES]
         self.lock_completed = False
@@ -1,7 +1,7 @@
 """Create the stint type editor widget."""
 
 from PyQt6.QtCore import QTimer
-from PyQt6.QtWidgets import QAbstractItemView, QHBoxLayout, QSizePolicy, QWidget
+from PyQt6.QtWidgets import QHBoxLayout, QSizePolicy, QWidget
 
 from ui.components.common import DropdownButton
 from ui.models.table_constants import ColumnIndex
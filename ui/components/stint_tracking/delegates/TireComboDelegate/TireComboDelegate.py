@@ -4,6 +4,8 @@ from PyQt6.QtWidgets import QStyledItemDelegate
 
 from .helpers import (
     _find_view,
+    _get_popup,
+    _release_popup,
     _update_button_text,
     create_editor,
     help_event,
@@ -25,6 +27,8 @@ class TireComboDelegate(QStyledItemDelegate):
     helpEvent = help_event
     _update_button_text = _update_button_text
     _find_view = _find_view
+    _get_popup = _get_popup
+    _release_popup = _release_popup
 
     def __init__(self, parent=None, update_doc: bool = False, strategy_id: str | None = None) -> None:
         super().__init__(parent)
@@ -32,4 +36,6 @@ class TireComboDelegate(QStyledItemDelegate):
         self.strategy_id = strategy_id
         self.tires_changed = "0"
         self.lock_completed = False
+        self._popup = None
+        self._popup_editor = None
         self.setObjectName("TireComboDelegate")
@@ -14,6 +14,47 @@ class TirePopup(QWidget):
 
     dataChanged = pyqtSignal()
 
+    # (wheel, grid row, grid column) for each compound dropdown
+    BOX_POSITIONS = (("fl", 1, 1), ("fr", 1, 3), ("rl", 2, 1), ("rr", 2, 3))
+
+    SIZE_BTN = QSize(36, 36)
+    SIZE_ICON = QSize(24, 24)
+    MEDIUM_ICON_PATH = resource_path("resources/icons/tires/medium.png")
+    WET_ICON_PATH = resource_path("resources/icons/tires/wet.png")
+
+    # (x, medium, wet) quick-set icons; decoded on first popup, then shared
+    _quick_set_icons: tuple[QIcon, QIcon, QIcon] | None = None
+
+    @classmethod
+    def _icons(cls) -> tuple[QIcon, QIcon, QIcon]:
+        if cls._quick_set_icons is None:
+            height = cls.SIZE_ICON.height()
+            cls._quick_set_icons = (
+                QIcon(load_icon("resources/icons/tires/x.svg", size=height + 4, color="#D1D5DC")),
+                QIcon(QPixmap(cls.MEDIUM_ICON_PATH).scaledToHeight(height, Qt.TransformationMode.SmoothTransformation)),
+                QIcon(QPixmap(cls.WET_ICON_PATH).scaledToHeight(height, Qt.TransformationMode.SmoothTransformation)),
+            )
+        return cls._quick_set_icons
+
+    # Compound entries for the wheel dropdowns; built once and shared by every box
+    _compound_items: tuple[dict, ...] | None = None
+
+    @classmethod
+    def _dropdown_items(cls) -> tuple[dict, ...]:
+        if cls._compound_items is None:
+            # Ready QIcons pass through DropdownButton's normalization as-is,
+            # so each box no longer loads the icon files again
+            medium = QIcon(cls.MEDIUM_ICON_PATH)
+            wet = QIcon(cls.WET_ICON_PATH)
+            cls._compound_items = (
+                {"display": "", "value": "", "icon": None},
+                {"display": "New", "value": "medium", "icon": medium},
+                {"display": "Used", "value": "used medium", "icon": medium},
+                {"display": "New", "value": "wet", "icon": wet},
+                {"display": "Used", "value": "used wet", "icon": wet},
+            )
+        return cls._compound_items
+
     def __init__(self, parent=None):
         super().__init__(parent, Qt.WindowType.Popup)
         self.setWindowFlag(Qt.WindowType.FramelessWindowHint, True)
@@ -30,17 +71,16 @@ class TirePopup(QWidget):
 
         layout = QGridLayout(container)
 
-        size_btn = QSize(36, 36)
-        size_icon = QSize(24, 24)
+        size_btn = self.SIZE_BTN
+        size_icon = self.SIZE_ICON
+        icon_x, icon_medium, icon_wet = self._icons()
 
         btn_x = QPushButton()
-        btn_x.setIcon(QIcon(load_icon("resources/icons/tires/x.svg", size=size_icon.height() + 4, color="#D1D5DC")))
+        btn_x.setIcon(icon_x)
         btn_medium = QPushButton()
-        medium_pixmap = QPixmap(resource_path("resources/icons/tires/medium.png"))
-        btn_medium.setIcon(QIcon(medium_pixmap.scaledToHeight(size_icon.height(), Qt.TransformationMode.SmoothTransformation)))
+        btn_medium.setIcon(icon_medium)
         btn_wet = QPushButton()
-        wet_pixmap = QPixmap(resource_path("resources/icons/tires/wet.png"))
-        btn_wet.setIcon(QIcon(wet_pixmap.scaledToHeight(size_icon.height(), Qt.TransformationMode.SmoothTransformation)))
+        btn_wet.setIcon(icon_wet)
 
         btn_x.clicked.connect(lambda: self.set_all_tires(None))
         btn_medium.clicked.connect(lambda: self.set_all_tires("medium"))
@@ -61,37 +101,30 @@ class TirePopup(QWidget):
         layout.addLayout(btn_layout, 0, 1)
 
         self.boxes = {}
-        dropdown_items = [
-            {"display": "", "value": "", "icon": None},
-            {"display": "New", "value": "medium", "icon": resource_path("resources/icons/tires/medium.png")},
-            {"display": "Used", "value": "used medium", "icon": resource_path("resources/icons/tires/medium.png")},
-            {"display": "New", "value": "wet", "icon": resource_path("resources/icons/tires/wet.png")},
-            {"display": "Used", "value": "used wet", "icon": resource_path("resources/icons/tires/wet.png")},
-        ]
-        for i, tire in enumerate(["FL", "FR", "RL", "RR"]):
-            row = (i // 2) + 1
-            col = (i % 2) * 2
+        dropdown_items = self._dropdown_items()
+        # Boxes are keyed by the lower-case wheel names the tire data uses
+        for tire, row, col in self.BOX_POSITIONS:
             cb = DropdownButton(items=dropdown_items, current_value="", sort_items=False, parent=container, button_object_name="TirePopupDropdown")
-            cb.valueChanged.connect(lambda _: self.dataChanged.emit())
-            layout.addWidget(cb, row, col + 1)
+            # Signal-to-signal; Qt drops valueChanged's str argument
+            cb.valueChanged.connect(self.dataChanged)
+            layout.addWidget(cb, row, col)
             self.boxes[tire] = cb
 
     def set_values(self, data: dict) -> None:
-        for tire in self.boxes:
-            tire_changed = data["tires_changed"][tire.lower()]
-            tire_compound = data[tire.lower()]["outgoing"]["compound"]
-            if tire_changed:
-                self.boxes[tire].set_value(tire_compound)
+        tires_changed = data["tires_changed"]
+        for tire, box in self.boxes.items():
+            if tires_changed[tire]:
+                box.set_value(data[tire]["outgoing"]["compound"])
             else:
-                self.boxes[tire].set_value("")
+                box.set_value("")
 
     def values(self) -> dict:
-        return {k: v.get_value() for k, v in self.boxes.items()}
+        """Return the selected compound per wheel, keyed like the tire data ("fl", ...)."""
+        return {tire: box.get_value() for tire, box in self.boxes.items()}
 
     def set_all_tires(self, compound: str | None = None) -> None:
-        for tire in self.boxes:
-            if compound:
-                self.boxes[tire].set_value(compound)
-            else:
-                self.boxes[tire].set_value("")
-            self.dataChanged.emit()
+        value = compound or ""
+        for box in self.boxes.values():
+            box.set_value(value)
+        # One commit for the whole preset rather than one per wheel
+        self.dataChanged.emit()
@@ -5,6 +5,8 @@ from .set_editor_data import set_editor_data
 from .set_model_data import set_model_data
 from .update_editor_geometry import update_editor_geometry
 from ._find_view import _find_view
+from ._get_popup import _get_popup
+from ._release_popup import _release_popup
 from ._update_button_text import _update_button_text
 
 __all__ = [
@@ -15,5 +17,7 @@ __all__ = [
     'set_model_data',
     'update_editor_geometry',
     '_find_view',
+    '_get_popup',
+    '_release_popup',
     '_update_button_text',
 ]
@@ -0,0 +1,31 @@
+"""Return the delegate's shared tire popup, bound to one editor."""
+
+from ui.components.stint_tracking.delegates.TireComboDelegate.TirePopup import TirePopup
+
+
+def _get_popup(self, view, editor) -> TirePopup:
+    """Build the popup on first use and point its commits at ``editor``.
+
+    Only one popup can be open at a time, so a single instance per
+    delegate serves every row's editor. The popup outlives its editors,
+    so an editor's destruction releases it (see ``_release_popup``).
+    """
+    if self._popup is None:
+        self._popup = TirePopup(view.viewport())
+
+        def commit() -> None:
+            if self._popup_editor is not None:
+                self.commitData.emit(self._popup_editor)
+
+        self._popup.dataChanged.connect(commit)
+
+    previous = self._popup_editor
+    if previous is not editor:
+        if previous is not None:
+            # The previous editor no longer owns the selection shown in the popup
+            previous.popup = None
+        editor.destroyed.connect(lambda _=None, e=editor: self._release_popup(e))
+
+    self._popup_editor = editor
+    editor.popup = self._popup
+    return self._popup
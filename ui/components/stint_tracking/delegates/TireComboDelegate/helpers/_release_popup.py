@@ -0,0 +1,11 @@
+"""Detach the shared tire popup from an editor that is going away."""
+
+
+def _release_popup(self, editor) -> None:
+    """Forget ``editor`` as the popup's target and close the popup if it was."""
+    if editor is not self._popup_editor:
+        return
+
+    self._popup_editor = None
+    if self._popup is not None:
+        self._popup.hide()
@@ -1,10 +1,9 @@
 """Create the tire combo editor with popup."""
 
 from PyQt6.QtCore import QTimer
-from PyQt6.QtWidgets import QAbstractItemView, QHBoxLayout, QSizePolicy, QWidget
+from PyQt6.QtWidgets import QHBoxLayout, QSizePolicy, QWidget
 
 from ui.components.common.ConfigButton import ConfigButton
-from ui.components.stint_tracking.delegates.TireComboDelegate.TirePopup import TirePopup
 from ui.models.table_constants import ColumnIndex
 from ui.models.TableRoles import TableRoles
 from ui.utilities import FONT, get_fonts
@@ -36,12 +35,15 @@ def create_editor(self, parent, option, index):
         if status is not None and "Completed" in str(status):
             btn.setEnabled(False)
 
-    popup = TirePopup(editor)
+    # Persistent editors exist for every row; they borrow the delegate's
+    # single popup when opened instead of each owning a widget tree.
+    editor.popup = None
 
     def show_popup():
         view = self._find_view(editor)
         if not view:
             return
+        popup = self._get_popup(view, editor)
         pos = btn.mapToGlobal(btn.rect().bottomLeft())
         pos.setY(pos.y() + 4)
         value = index.data(TableRoles.TiresRole)
@@ -49,10 +51,8 @@ def create_editor(self, parent, option, index):
         popup.move(pos)
         popup.show()
 
-    popup.dataChanged.connect(lambda: self.commitData.emit(editor))
     btn.clicked.connect(show_popup)
 
-    editor.popup = popup
     editor.btn = btn
 
     if not self.strategy_id:
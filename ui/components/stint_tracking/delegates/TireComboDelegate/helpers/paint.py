@@ -1,6 +1,6 @@
 """Paint model background and attention badge."""
 
-from PyQt6.QtCore import QPoint, QRect, Qt
+from PyQt6.QtCore import QPoint, Qt
 from PyQt6.QtGui import QColor, QPolygon
 
 from ui.components.stint_tracking.delegates.delegate_utils import paint_model_background
@@ -1,7 +1,5 @@
 """Populate tire editor from model."""
 
-from ui.models.TableRoles import TableRoles
-
 
 def set_editor_data(self, editor, index):
     editor.blockSignals(True)
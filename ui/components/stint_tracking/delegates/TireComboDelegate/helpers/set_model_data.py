@@ -1,21 +1,25 @@
 """Persist tire popup selections to model and DB if enabled."""
 
-import copy
-
 from core.database import update_strategy, update_stint
 from core.errors import log
 from ui.models.TableRoles import TableRoles
-from ui.models.stint_helpers import sanitize_stints
+from ui.models.stint_helpers import copy_tire_data, sanitize_stints
 
 
 def set_model_data(self, editor, model, index):
+    if editor.popup is None:
+        # Popup never opened, so there is no selection to persist
+        return
+
     values = editor.popup.values()
-    values_lowered = {k.lower(): v.lower() for k, v in values.items()}
 
     old_value = model.data(index, TableRoles.TiresRole)
-    new_value = copy.deepcopy(old_value)
+    new_value = copy_tire_data(old_value)
 
-    for tire, compound in values_lowered.items():
+    # Popup keys are already the lower-case wheel names; compounds seeded
+    # from stored data may not be, so those are still normalised
+    for tire, compound in values.items():
+        compound = compound.lower()
         new_value["tires_changed"][tire] = bool(compound)
         if compound:
             new_value[tire]["outgoing"]["compound"] = compound
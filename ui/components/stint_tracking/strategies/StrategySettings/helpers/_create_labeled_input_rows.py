@@ -4,7 +4,6 @@ from PyQt6.QtWidgets import QCheckBox, QLabel, QVBoxLayout
 
 from ui.components.common import LabeledInputRow
 from ui.components.stint_tracking.config.config_constants import ConfigLayout
-from ui.components.stint_tracking.config import ConfigLabels
 from ui.utilities import FONT, get_fonts
 from ._on_text_changed import _on_text_changed
 
@@ -0,0 +1,18 @@
+"""Event filter that reconciles strategy editors when the table viewport resizes."""
+
+from __future__ import annotations
+
+from PyQt6.QtCore import QEvent, QObject
+
+
+class EditorViewportFilter(QObject):
+    """Forwards table viewport resize events to StrategyTab._sync_visible_editors."""
+
+    def __init__(self, strategy_tab: QObject) -> None:
+        super().__init__(strategy_tab)
+        self._strategy_tab = strategy_tab
+
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:
+        if event.type() == QEvent.Type.Resize:
+            self._strategy_tab._sync_visible_editors()
+        return False  # never swallow the event
@@ -9,7 +9,7 @@ from PyQt6.QtCore import QThread, pyqtSignal
 
 from core.database import update_strategy
 from core.errors import log_exception
-from ui.models.stint_helpers import sanitize_stints
+from ui.models.stint_helpers import copy_tire_data, sanitize_stints
 from ui.models.table_constants import ColumnIndex
 from ui.models.table_processors import recalculate_pending_tires_changed
 
@@ -33,10 +33,12 @@ class StrategySyncWorker(QThread):
         super().__init__()
         self.strategy = copy.deepcopy(strategy)
         self.strategy_name = strategy_name
-        self.tracker_rows = copy.deepcopy(tracker_rows)
-        self.tracker_tires = copy.deepcopy(tracker_tires)
-        self.strategy_rows = copy.deepcopy(strategy_rows)
-        self.strategy_tires = copy.deepcopy(strategy_tires)
+        # Rows are flat scalar lists and tire dicts have a fixed shape, so
+        # snapshot them with targeted copies rather than deepcopy
+        self.tracker_rows = [row[:] for row in tracker_rows]
+        self.tracker_tires = [copy_tire_data(tire_data) for tire_data in tracker_tires]
+        self.strategy_rows = [row[:] for row in strategy_rows]
+        self.strategy_tires = [copy_tire_data(tire_data) for tire_data in strategy_tires]
         self.mean_stint_time_seconds = mean_stint_time_seconds
 
     def run(self) -> None:
@@ -4,21 +4,24 @@ from PyQt6.QtCore import pyqtSignal
 from PyQt6.QtWidgets import QWidget
 
 from ui.models import SelectionModel, TableModel
-from ui.utilities.load_style import load_style
 
 from .StrategySyncWorker import StrategySyncWorker
 from .helpers import (
     _apply_sync_from_tracker_result,
     _clear_sync_worker,
+    _ensure_built,
     _handle_sync_from_tracker_failed,
+    _install_editor_listeners,
     _load_strategy_data,
     _on_delete_clicked,
     _on_exclude_clicked,
     _on_settings_deleted,
     _open_persistent_editors,
+    _populate_strategy_model,
     _setup_strategy_delegates,
     _setup_ui,
     _sync_from_tracker,
+    _sync_visible_editors,
     _strategy_updated,
 )
 
@@ -32,19 +35,27 @@ class StrategyTab(QWidget):
 
     _apply_sync_from_tracker_result = _apply_sync_from_tracker_result
     _clear_sync_worker = _clear_sync_worker
+    _ensure_built = _ensure_built
     _handle_sync_from_tracker_failed = _handle_sync_from_tracker_failed
     _setup_ui = _setup_ui
     _load_strategy_data = _load_strategy_data
+    _populate_strategy_model = _populate_strategy_model
     _setup_strategy_delegates = _setup_strategy_delegates
     _open_persistent_editors = _open_persistent_editors
+    _sync_visible_editors = _sync_visible_editors
+    _install_editor_listeners = _install_editor_listeners
     _strategy_updated = _strategy_updated
     _on_settings_deleted = _on_settings_deleted
     _on_delete_clicked = _on_delete_clicked
     _on_exclude_clicked = _on_exclude_clicked
     _sync_from_tracker = _sync_from_tracker
 
-    def __init__(self, strategy: dict, table_model: TableModel, selection_model: SelectionModel):
-        """Initialize a strategy tab with a cloned strategy model and tracker source model."""
+    def __init__(self, strategy: dict, table_model: TableModel, selection_model: SelectionModel, rows: list[list] | None = None):
+        """Initialize a strategy tab; its contents are built by ``_ensure_built`` on first show.
+
+        ``rows`` may carry the strategy's stints already converted by
+        ``mongo_docs_to_rows`` so the first build skips that step.
+        """
         super().__init__()
 
         self.strategy = strategy
@@ -53,11 +64,13 @@ class StrategyTab(QWidget):
         self.selection_model = selection_model
         self.tracker_table_model = table_model
         self._sync_worker: StrategySyncWorker | None = None
+        self._preloaded_rows = rows
 
-        self.table_model = table_model.clone()
-        self.table_model._is_strategy = True
+        self.table_model: TableModel | None = None
         self._lock_completed = False
+        self._built = False
+        self._editor_filter = None
 
-        load_style('resources/styles/stint_tracking/strategy_tab.qss', widget=self)
-        self._setup_ui()
-        self._load_strategy_data()
+    def showEvent(self, event):
+        self._ensure_built()
+        super().showEvent(event)
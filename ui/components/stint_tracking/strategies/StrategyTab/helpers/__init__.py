@@ -1,27 +1,35 @@
 from ._apply_sync_from_tracker_result import _apply_sync_from_tracker_result
 from ._clear_sync_worker import _clear_sync_worker
+from ._ensure_built import _ensure_built
 from ._handle_sync_from_tracker_failed import _handle_sync_from_tracker_failed
+from ._install_editor_listeners import _install_editor_listeners
 from ._load_strategy_data import _load_strategy_data
 from ._on_delete_clicked import _on_delete_clicked
 from ._on_exclude_clicked import _on_exclude_clicked
 from ._on_settings_deleted import _on_settings_deleted
 from ._open_persistent_editors import _open_persistent_editors
+from ._populate_strategy_model import _populate_strategy_model
 from ._setup_strategy_delegates import _setup_strategy_delegates
 from ._setup_ui import _setup_ui
 from ._sync_from_tracker import _sync_from_tracker
+from ._sync_visible_editors import _sync_visible_editors
 from ._strategy_updated import _strategy_updated
 
 __all__ = [
     '_apply_sync_from_tracker_result',
     '_clear_sync_worker',
+    '_ensure_built',
     '_handle_sync_from_tracker_failed',
+    '_install_editor_listeners',
     '_load_strategy_data',
     '_on_delete_clicked',
     '_on_exclude_clicked',
     '_on_settings_deleted',
     '_open_persistent_editors',
+    '_populate_strategy_model',
     '_setup_strategy_delegates',
     '_setup_ui',
     '_sync_from_tracker',
+    '_sync_visible_editors',
     '_strategy_updated',
 ]
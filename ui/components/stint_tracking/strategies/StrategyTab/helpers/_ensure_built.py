@@ -0,0 +1,40 @@
+"""Build a strategy tab's contents on first use."""
+
+from __future__ import annotations
+
+from core.errors import log_exception
+from ui.utilities.load_style import load_style
+
+
+def _ensure_built(self) -> None:
+    """Clone the tracker model and build the table the first time it is needed.
+
+    Tabs are created for every strategy in the session but only one is
+    visible at a time, so the model clone, StintTable and persistent
+    editors wait until the tab is shown or synced.
+    """
+    if self._built:
+        return
+    self._built = True
+
+    self.table_model = self.tracker_table_model.clone()
+    self.table_model._is_strategy = True
+
+    load_style('resources/styles/stint_tracking/strategy_tab.qss', widget=self)
+
+    # Fill the clone before the StintTable attaches, so the view starts
+    # from the strategy rows instead of replaying them as row updates
+    try:
+        populated = self._populate_strategy_model()
+    except Exception as e:
+        log_exception(
+            e,
+            f'Failed to load strategy data for {self.strategy_name}',
+            category='strategy_tab',
+            action='ensure_built',
+        )
+        populated = False
+
+    self._setup_ui()
+    if populated:
+        self._load_strategy_data(populate=False)
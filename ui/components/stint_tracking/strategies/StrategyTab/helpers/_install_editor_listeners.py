@@ -0,0 +1,22 @@
+"""Open persistent editors as strategy table rows come into view."""
+
+from __future__ import annotations
+
+from ..EditorViewportFilter import EditorViewportFilter
+
+
+def _install_editor_listeners(self) -> None:
+    """Reconcile editors whenever the table scrolls, resizes or its rows change.
+
+    Called once the delegates exist, so rows revealed later open the
+    strategy editors rather than default line edits.
+    """
+    if getattr(self, '_editor_filter', None) is not None:
+        return  # already installed
+
+    table = self.stint_table.table
+    table.verticalScrollBar().valueChanged.connect(lambda _: self._sync_visible_editors())
+    self.table_model.editorsNeedRefresh.connect(self._sync_visible_editors)
+
+    self._editor_filter = EditorViewportFilter(self)
+    table.viewport().installEventFilter(self._editor_filter)
@@ -0,0 +1,49 @@
+"""Fill the strategy tab's table model from the strategy document."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from core.errors import log
+from ui.models.mongo_docs_to_rows import mongo_docs_to_rows
+
+
+def _populate_strategy_model(self) -> bool:
+    """Load the strategy's stints into ``table_model`` in one update.
+
+    Returns False when the strategy has no stints and the model was left
+    untouched.
+    """
+    model_data = self.strategy.get('model_data', {})
+    stints = model_data.get('rows', [])
+    tires = model_data.get('tires', [])
+    mean_stint_time_seconds = self.strategy.get('mean_stint_time_seconds', 0)
+
+    # Rows parsed by the strategies loader are only valid for the first load
+    rows = self._preloaded_rows
+    self._preloaded_rows = None
+
+    if not stints:
+        log(
+            'INFO',
+            f'No stints in strategy {self.strategy_name}',
+            category='strategy_tab',
+            action='load_strategy_data',
+        )
+        return False
+
+    if rows is None:
+        rows = mongo_docs_to_rows(stints)
+    self.table_model.update_data(
+        data=rows,
+        tires=tires,
+        mean_stint_time=timedelta(seconds=mean_stint_time_seconds),
+    )
+
+    log(
+        'DEBUG',
+        f'Loaded {len(rows)} stints for strategy {self.strategy_name}',
+        category='strategy_tab',
+        action='load_strategy_data',
+    )
+    return True
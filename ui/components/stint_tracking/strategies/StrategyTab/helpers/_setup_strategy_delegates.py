@@ -40,6 +40,7 @@ def _setup_strategy_delegates(self) -> None:
         self.stint_table.table.setItemDelegateForColumn(ColumnIndex.ACTIONS, self.actions_delegate)
         self.stint_table.actions_delegate = self.actions_delegate
         self.stint_table._set_column_widths()
+        self._install_editor_listeners()
 
         log(
             'DEBUG',
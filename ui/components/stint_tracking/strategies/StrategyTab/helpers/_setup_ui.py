@@ -31,6 +31,8 @@ def _setup_ui(self) -> None:
         focus=True,
         auto_update=False,
         allow_editors=False,
+        # Editors follow the viewport and lock rules in _sync_visible_editors
+        refresh_editors=False,
     )
     layout.addWidget(self.stint_table, stretch=1)
 
@@ -28,6 +28,9 @@ def _sync_from_tracker(self) -> None:
         )
         return
 
+    # Auto-sync can target a tab that has never been shown
+    self._ensure_built()
+
     tracker_rows, tracker_tires, _ = tracker_model.get_all_data()
     strategy_rows, strategy_tires, _ = self.table_model.get_all_data()
 
@@ -0,0 +1,71 @@
+"""Reconcile persistent editors for the rows currently in the viewport."""
+
+from __future__ import annotations
+
+from ui.models.table_constants import ColumnIndex
+
+
+def _sync_visible_editors(self) -> int:
+    """Open or close persistent editors for the visible rows, respecting locks.
+
+    Rows outside the viewport are left alone and picked up when they are
+    scrolled or resized into view. Returns the number of rows reconciled.
+    """
+    table = self.stint_table.table
+    model = self.table_model
+    row_count = model.rowCount()
+    if row_count == 0:
+        return 0
+
+    # rowAt is -1 past the last row, i.e. the viewport shows the table's end
+    first = max(table.rowAt(0), 0)
+    last = table.rowAt(table.viewport().height() - 1)
+    if last < 0:
+        last = row_count - 1
+
+    lock_enabled = getattr(self, '_lock_completed', False)
+
+    # Bound once; the loop below runs per visible row on every scroll step
+    index = model.index
+    is_open_editor = table.isPersistentEditorOpen
+    status_col = ColumnIndex.STATUS
+    stint_type_col = ColumnIndex.STINT_TYPE
+    tires_col = ColumnIndex.TIRES_CHANGED
+
+    # (index, should_open) for every editor whose state has to flip
+    changes = []
+    for row in range(first, last + 1):
+        # Status only matters when completed stints are locked
+        locked = False
+        if lock_enabled:
+            status_val = index(row, status_col).data()
+            locked = status_val is not None and "Completed" in str(status_val)
+
+        stint_type_index = index(row, stint_type_col)
+        # avoid str(None) producing "None" which is truthy when stripped
+        val = stint_type_index.data()
+        wants_editor = not locked and val is not None and bool(str(val).strip())
+        if wants_editor != is_open_editor(stint_type_index):
+            changes.append((stint_type_index, wants_editor))
+
+        tires_index = index(row, tires_col)
+        if locked == is_open_editor(tires_index):
+            changes.append((tires_index, not locked))
+
+    if not changes:
+        # Scrolling over rows that already have editors needs no repaint hold
+        return last - first + 1
+
+    # Editors are created row by row; paint the table once when done
+    updates_enabled = table.updatesEnabled()
+    table.setUpdatesEnabled(False)
+    try:
+        for editor_index, should_open in changes:
+            if should_open:
+                table.openPersistentEditor(editor_index)
+            else:
+                table.closePersistentEditor(editor_index)
+    finally:
+        table.setUpdatesEnabled(updates_enabled)
+
+    return last - first + 1
@@ -0,0 +1,41 @@
+"""Background worker for fetching a session's strategies."""
+
+from __future__ import annotations
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from core.database import get_strategies
+from core.errors import log_exception
+from ui.models.mongo_docs_to_rows import mongo_docs_to_rows
+
+
+class StrategiesLoadWorker(QThread):
+    """Query the strategies for one session off the GUI thread."""
+
+    strategies_ready = pyqtSignal(str, list, list)
+
+    def __init__(self, session_id: str, parent=None) -> None:
+        super().__init__(parent)
+        self.session_id = session_id
+
+    def run(self) -> None:
+        """Materialize the strategy cursor and parse each strategy's stints.
+
+        Rows are emitted alongside the documents, index for index; a
+        strategy whose stints fail to parse gets None and is parsed (and
+        its error logged) by its tab instead.
+        """
+        try:
+            strategies = list(get_strategies(self.session_id))
+        except Exception as exc:
+            log_exception(exc, "Failed to load strategies", category="strategies_view", action="load_strategies")
+            return
+
+        parsed_rows = []
+        for strategy in strategies:
+            try:
+                parsed_rows.append(mongo_docs_to_rows(strategy.get("model_data", {}).get("rows", [])))
+            except Exception:
+                parsed_rows.append(None)
+
+        self.strategies_ready.emit(self.session_id, strategies, parsed_rows)
@@ -1,6 +1,6 @@
 """Strategies view for managing race strategies."""
 
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import QTimer, pyqtSignal
 from PyQt6.QtWidgets import QWidget
 
 from ui.models import ModelContainer
@@ -8,6 +8,9 @@ from ui.utilities.load_style import load_style
 
 from .helpers import (
     _add_tab,
+    _apply_loaded_strategies,
+    _clear_load_worker,
+    _shutdown_load_worker,
     _clear_tabs,
     _create_strategy_tab,
     _load_strategies,
@@ -28,6 +31,8 @@ class StrategiesView(QWidget):
 
     strategy_created = pyqtSignal(dict)
 
+    LOAD_WORKER_SHUTDOWN_MS = 2000
+
     _setup_ui = _setup_ui
     _on_tab_changed = _on_tab_changed
     _load_strategies = _load_strategies
@@ -41,6 +46,9 @@ class StrategiesView(QWidget):
     _remove_tab = _remove_tab
     _update_tab_label = _update_tab_label
     _add_tab = _add_tab
+    _apply_loaded_strategies = _apply_loaded_strategies
+    _clear_load_worker = _clear_load_worker
+    _shutdown_load_worker = _shutdown_load_worker
 
     def __init__(self, models: ModelContainer):
         super().__init__()
@@ -53,8 +61,16 @@ class StrategiesView(QWidget):
         self.tab_bar = None
         self.stacked_widget = None
         self.sync_widget = None
+        self._load_worker = None
+        self._reload_pending = False
 
-        self.selection_model.sessionChanged.connect(self._on_session_changed)
+        # A burst of session changes (e.g. the picker repopulating) reloads
+        # the strategies once, on the next event-loop pass
+        self._session_reload_timer = QTimer(self)
+        self._session_reload_timer.setSingleShot(True)
+        self._session_reload_timer.setInterval(0)
+        self._session_reload_timer.timeout.connect(self._on_session_changed)
+        self.selection_model.sessionChanged.connect(lambda *_: self._session_reload_timer.start())
 
         self._setup_ui()
         load_style('resources/styles/stint_tracking/strategies.qss', widget=self)
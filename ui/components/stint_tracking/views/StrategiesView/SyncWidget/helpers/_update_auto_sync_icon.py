@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from ui.utilities.load_icon import load_icon
+from ui.utilities.icon_cache import get_cached_icon
 
 
 def _update_auto_sync_icon(self, enabled: bool) -> None:
@@ -12,4 +12,4 @@ def _update_auto_sync_icon(self, enabled: bool) -> None:
 
     icon_path = "resources/icons/strategies/wifi.svg" if enabled else "resources/icons/strategies/wifi-off.svg"
     icon_color = "#07a14b" if enabled else "#506079"
-    self.auto_sync_icon_label.setPixmap(load_icon(icon_path, 14, color=icon_color))
\ No newline at end of file
+    self.auto_sync_icon_label.setPixmap(get_cached_icon(icon_path, 14, icon_color))
\ No newline at end of file
@@ -11,6 +11,9 @@ from ._remove_tab import _remove_tab
 from ._sync_current_strategy import _sync_current_strategy
 from ._update_tab_label import _update_tab_label
 from ._add_tab import _add_tab
+from ._apply_loaded_strategies import _apply_loaded_strategies
+from ._clear_load_worker import _clear_load_worker
+from ._shutdown_load_worker import _shutdown_load_worker
 
 __all__ = [
     "_setup_ui",
@@ -26,4 +29,7 @@ __all__ = [
     "_sync_current_strategy",
     "_update_tab_label",
     "_add_tab",
+    "_apply_loaded_strategies",
+    "_clear_load_worker",
+    "_shutdown_load_worker",
 ]
@@ -0,0 +1,28 @@
+"""Populate strategy tabs from a finished background load."""
+
+from core.errors import log, log_exception
+
+
+def _apply_loaded_strategies(self, session_id: str, strategies: list, parsed_rows: list) -> None:
+    """Rebuild the tabs from fetched strategies if their session is still selected.
+
+    ``parsed_rows`` holds the worker-parsed stint rows for each strategy.
+    """
+    if session_id != str(self.selection_model.session_id):
+        log("DEBUG", "Discarding strategies for a session that is no longer selected", category="strategies_view", action="load_strategies")
+        return
+
+    try:
+        if not strategies:
+            log("INFO", "No strategies found - creating default strategy", category="strategies_view", action="load_strategies")
+            default_strategy = self._on_create_strategy(name="Default")
+            strategies = [default_strategy] if default_strategy else []
+            parsed_rows = [None] * len(strategies)
+
+        self._clear_tabs()
+
+        for strategy, rows in zip(strategies, parsed_rows):
+            tab = self._create_strategy_tab(strategy, rows=rows)
+            self._add_tab(tab, strategy["name"])
+    except Exception as exc:
+        log_exception(exc, "Failed to load strategies", category="strategies_view", action="load_strategies")
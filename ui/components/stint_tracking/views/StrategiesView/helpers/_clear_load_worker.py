@@ -0,0 +1,14 @@
+"""Clear the active strategies load worker reference."""
+
+from __future__ import annotations
+
+
+def _clear_load_worker(self, worker: object | None = None) -> None:
+    """Forget the finished load worker and run a reload queued behind it."""
+    if worker is not self._load_worker:
+        return
+
+    self._load_worker = None
+    if self._reload_pending:
+        self._reload_pending = False
+        self._load_strategies()
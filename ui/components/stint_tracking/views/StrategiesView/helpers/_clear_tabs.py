@@ -4,13 +4,28 @@ from core.errors import log
 
 
 def _clear_tabs(self) -> None:
-    """Remove all tabs and stacked widgets."""
-    while self.tab_bar.count() > 0:
-        self.tab_bar.removeTab(0)
+    """Remove all tabs and stacked widgets.
 
-    while self.stacked_widget.count() > 0:
-        widget = self.stacked_widget.widget(0)
-        self.stacked_widget.removeWidget(widget)
+    Tabs build their table on first show, so the teardown must not make
+    another tab current on the way out: tab bar signals are blocked while
+    tabs are removed, and the current page is removed last.
+    """
+    was_blocked = self.tab_bar.blockSignals(True)
+    try:
+        while self.tab_bar.count() > 0:
+            self.tab_bar.removeTab(0)
+    finally:
+        self.tab_bar.blockSignals(was_blocked)
+
+    stacked = self.stacked_widget
+    current = stacked.currentWidget()
+    widgets = [stacked.widget(i) for i in range(stacked.count())]
+    if current is not None:
+        widgets.remove(current)
+        widgets.append(current)
+
+    for widget in widgets:
+        stacked.removeWidget(widget)
         widget.deleteLater()
 
     if self.sync_widget is not None:
@@ -3,9 +3,9 @@
 from ui.components.stint_tracking.strategies import StrategyTab
 
 
-def _create_strategy_tab(self, strategy: dict):
-    """Create a tab widget for an existing strategy."""
-    tab = StrategyTab(strategy=strategy, table_model=self.table_model, selection_model=self.selection_model)
+def _create_strategy_tab(self, strategy: dict, rows: list[list] | None = None):
+    """Create a tab widget for an existing strategy, optionally with its stints pre-parsed."""
+    tab = StrategyTab(strategy=strategy, table_model=self.table_model, selection_model=self.selection_model, rows=rows)
     tab.name_changed.connect(lambda new_name, t=tab: self._update_tab_label(t, new_name))
     tab.deleted.connect(lambda sid, t=tab: self._remove_tab(t))
     tab.sync_completed.connect(
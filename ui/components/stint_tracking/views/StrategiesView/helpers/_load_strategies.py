@@ -1,29 +1,36 @@
 """Load strategies for the current session and populate tabs."""
 
-from core.errors import log, log_exception
-from core.database import get_strategies
+from core.errors import log
+from ui.utilities.loading_queue import LoadingQueue
 
+from ..StrategiesLoadWorker import StrategiesLoadWorker
 
-def _load_strategies(self) -> None:
-    """Load strategies for current session and populate tabs."""
-    try:
-        session_id = self.selection_model.session_id
-        if not session_id:
-            log("DEBUG", "No session selected - clearing strategy tabs", category="strategies_view", action="load_strategies")
-            self._clear_tabs()
-            return
+MESSAGE = "Loading strategies for new session..."
 
-        strategies = list(get_strategies(session_id))
 
-        if not strategies:
-            log("INFO", "No strategies found - creating default strategy", category="strategies_view", action="load_strategies")
-            default_strategy = self._on_create_strategy(name="Default")
-            strategies = [default_strategy] if default_strategy else []
+def _load_strategies(self) -> None:
+    """Start fetching the current session's strategies in the background.
 
+    The tabs are rebuilt by ``_apply_loaded_strategies`` once the worker
+    reports back, so the GUI stays responsive during the database query.
+    """
+    session_id = self.selection_model.session_id
+    if not session_id:
+        log("DEBUG", "No session selected - clearing strategy tabs", category="strategies_view", action="load_strategies")
         self._clear_tabs()
+        return
+
+    if self._load_worker is not None:
+        # One query at a time; _clear_load_worker reloads for the latest
+        # selection once the running one finishes
+        self._reload_pending = True
+        return
 
-        for strategy in strategies:
-            tab = self._create_strategy_tab(strategy)
-            self._add_tab(tab, strategy["name"])
-    except Exception as exc:
-        log_exception(exc, "Failed to load strategies", category="strategies_view", action="load_strategies")
+    LoadingQueue.push(MESSAGE)
+    worker = StrategiesLoadWorker(str(session_id), parent=self)
+    worker.strategies_ready.connect(self._apply_loaded_strategies)
+    worker.finished.connect(lambda w=worker: self._clear_load_worker(w))
+    worker.finished.connect(lambda: LoadingQueue.pop(MESSAGE))
+    worker.finished.connect(worker.deleteLater)
+    self._load_worker = worker
+    worker.start()
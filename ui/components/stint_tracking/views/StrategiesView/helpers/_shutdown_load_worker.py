@@ -0,0 +1,23 @@
+"""Stop background strategy loading before the view goes away."""
+
+from __future__ import annotations
+
+from core.errors import log
+
+
+def _shutdown_load_worker(self) -> None:
+    """Drop any queued reload and give an in-flight query a bounded time to finish.
+
+    A query stuck on server selection can take up to pymongo's timeout, so
+    instead of blocking app close the worker is detached from this view and
+    left to finish on its own.
+    """
+    self._reload_pending = False
+    worker = self._load_worker
+    if worker is None:
+        return
+
+    if not worker.wait(self.LOAD_WORKER_SHUTDOWN_MS):
+        # Parented workers are destroyed with the view; a running QThread must not be
+        worker.setParent(None)
+        log("WARNING", "Strategies load still running at shutdown", category="strategies_view", action="shutdown_load_worker")
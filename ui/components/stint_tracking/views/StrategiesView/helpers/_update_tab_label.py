@@ -12,6 +12,5 @@ def _update_tab_label(self, widget: QWidget, new_label: str) -> None:
         log("INFO", f"Updating tab label at index {index} to \"{new_label}\"", category="strategies_view", action="update_tab_label")
         self.tab_bar.setTabText(index, new_label)
         self.tab_bar.update()
-        self.tab_bar.repaint()
     else:
         log("WARNING", "Attempted to update label for non-existent tab", category="strategies_view", action="update_tab_label")
@@ -12,6 +12,7 @@ from .helpers import (
     _on_show,
     _on_tracker_started,
     _on_tracker_stopped,
+    _poll_agents,
     _setup_ui,
     _sync_top_row_heights,
     _start_polling_timer,
@@ -38,6 +39,7 @@ class TrackerView(QWidget):
     _on_tracker_started = _on_tracker_started
     _on_tracker_stopped = _on_tracker_stopped
     _startup_tick = _startup_tick
+    _poll_agents = _poll_agents
     _start_polling_timer = _start_polling_timer
     _toggle_left_column = _toggle_left_column
     closeEvent = closeEvent
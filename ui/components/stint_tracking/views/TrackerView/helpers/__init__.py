@@ -9,6 +9,7 @@ from ._on_tracker_started import _on_tracker_started
 from ._startup_tick import _startup_tick
 from ._start_polling_timer import _start_polling_timer
 from ._on_tracker_stopped import _on_tracker_stopped
+from ._poll_agents import _poll_agents
 from ._toggle_left_column import _toggle_left_column
 
 __all__ = [
@@ -23,5 +24,6 @@ __all__ = [
     "_startup_tick",
     "_start_polling_timer",
     "_on_tracker_stopped",
+    "_poll_agents",
     "_toggle_left_column",
 ]
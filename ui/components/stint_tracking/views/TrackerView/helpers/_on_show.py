@@ -12,3 +12,7 @@ def _on_show(self, event: QShowEvent) -> None:
     self._install_viewport_listener()
     self._sync_top_row_heights()
     self._update_controls_width()
+
+    # Poll ticks are skipped while hidden, so catch up on becoming visible.
+    if self._poll_timer is not None and self._poll_timer.isActive():
+        self.agent_overview._load_agents()
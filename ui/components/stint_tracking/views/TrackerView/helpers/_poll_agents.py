@@ -0,0 +1,12 @@
+"""Poll the agent overview while the tracker view is visible."""
+
+from PyQt6.QtCore import pyqtSlot
+
+
+@pyqtSlot()
+def _poll_agents(self) -> None:
+    """Reload agents on a poll tick, skipping ticks while the view is hidden."""
+    if not self.isVisible():
+        return
+
+    self.agent_overview._load_agents()
@@ -15,5 +15,5 @@ def _start_polling_timer(self) -> None:
         interval = 5
 
     self._poll_timer = QTimer(self)
-    self._poll_timer.timeout.connect(self.agent_overview._load_agents)
+    self._poll_timer.timeout.connect(self._poll_agents)
     self._poll_timer.start(interval * 1000)
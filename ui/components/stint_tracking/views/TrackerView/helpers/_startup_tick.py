@@ -1,6 +1,9 @@
 """Handle the startup polling burst ticks."""
 
+from PyQt6.QtCore import pyqtSlot
 
+
+@pyqtSlot()
 def _startup_tick(self) -> None:
     """Poll agents during the startup burst, then transition to normal interval."""
     self._startup_count += 1
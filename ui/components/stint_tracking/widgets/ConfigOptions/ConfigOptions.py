@@ -1,6 +1,6 @@
 """Configuration panel for stint tracking."""
 
-from PyQt6.QtCore import QProcess, pyqtSignal
+from PyQt6.QtCore import QProcess, QTimer, pyqtSignal
 from PyQt6.QtWidgets import QWidget
 
 from ui.components.common import PopUp
@@ -11,9 +11,11 @@ from core.errors import log_exception
 from .helpers import (
     _add_config_rows,
     _apply_form_state,
+    _apply_saved_config,
     _can_switch_views,
     _cancel_changes,
     _capture_form_state,
+    _clear_save_worker,
     _clone_event,
     _create_button_layout,
     _create_buttons,
@@ -22,6 +24,7 @@ from .helpers import (
     _handle_output,
     _handle_process_error,
     _handle_process_finished,
+    _handle_save_failed,
     _handle_save_shortcut,
     _handle_stderr,
     _handle_stdout,
@@ -46,6 +49,8 @@ class ConfigOptions(QWidget):
     tracker_started = pyqtSignal()
     tracker_stopped = pyqtSignal()
 
+    LABEL_REFRESH_DELAY_MS = 50
+
     _setup_ui = _setup_ui
     _create_buttons = _create_buttons
     _add_config_rows = _add_config_rows
@@ -59,6 +64,8 @@ class ConfigOptions(QWidget):
     _flash_taskbar = _flash_taskbar
     _toggle_edit = _toggle_edit
     _save_config = _save_config
+    _apply_saved_config = _apply_saved_config
+    _clear_save_worker = _clear_save_worker
     _clone_event = _clone_event
     _create_session = _create_session
     _toggle_track = _toggle_track
@@ -71,6 +78,7 @@ class ConfigOptions(QWidget):
     _handle_agent_registration_conflict = _handle_agent_registration_conflict
     _handle_process_error = _handle_process_error
     _handle_process_finished = _handle_process_finished
+    _handle_save_failed = _handle_save_failed
     _revert_tracking_state = _revert_tracking_state
     _shutdown_tracking = _shutdown_tracking
 
@@ -86,6 +94,7 @@ class ConfigOptions(QWidget):
         self.inputs = {}
         self.driver_inputs = []
         self.p: QProcess | None = None
+        self._save_worker = None
         self._tracking_active = False
         self.agent_name = None
         self._committed_form_state: dict[str, str | list[str]] | None = None
@@ -95,8 +104,13 @@ class ConfigOptions(QWidget):
         load_style('resources/styles/stint_tracking/tracker/config_options.qss', widget=self)
 
         self.selection_model.view_change_guard = self._can_switch_views
-        self.selection_model.eventChanged.connect(self._refresh_labels)
-        self.selection_model.sessionChanged.connect(self._refresh_labels)
+        # eventChanged is usually followed by sessionChanged; refresh once for both
+        self._label_refresh_timer = QTimer(self)
+        self._label_refresh_timer.setSingleShot(True)
+        self._label_refresh_timer.setInterval(self.LABEL_REFRESH_DELAY_MS)
+        self._label_refresh_timer.timeout.connect(self._refresh_labels)
+        self.selection_model.eventChanged.connect(lambda *_: self._label_refresh_timer.start())
+        self.selection_model.sessionChanged.connect(lambda *_: self._label_refresh_timer.start())
 
         self._setup_ui()
         self._refresh_labels()
@@ -0,0 +1,63 @@
+"""Background worker for persisting ConfigOptions edits."""
+
+from __future__ import annotations
+
+from PyQt6.QtCore import QObject, QThread, pyqtSignal
+
+from core.database import update_event, update_session, update_team_drivers
+from core.errors import log_exception
+
+
+class ConfigSaveWorker(QThread):
+    """Write changed event, session and team documents off the GUI thread."""
+
+    save_ready = pyqtSignal(dict)
+    save_failed = pyqtSignal(str)
+
+    def __init__(
+        self,
+        form_state: dict,
+        event_id: str = None,
+        session_id: str = None,
+        team_id: str = None,
+        parent: QObject = None,
+    ) -> None:
+        super().__init__(parent)
+        self.form_state = form_state
+        self.event_id = event_id
+        self.session_id = session_id
+        self.team_id = team_id
+
+    def run(self) -> None:
+        """Issue only the writes whose ids were supplied."""
+        form_state = self.form_state
+        try:
+            if self.event_id:
+                update_event(
+                    self.event_id,
+                    name=form_state['event_name'],
+                    tires=form_state['tires'],
+                    length=form_state['length'],
+                    start_time=form_state['start_time'],
+                )
+
+            if self.session_id:
+                update_session(
+                    self.session_id,
+                    name=form_state['session_name'],
+                    tires_remaining_at_green_flag=int(form_state['tires_remaining_at_green_flag']),
+                )
+
+            if self.team_id:
+                update_team_drivers(self.team_id, form_state['drivers'])
+
+            self.save_ready.emit(
+                {
+                    "form_state": form_state,
+                    "reload_table": bool(self.event_id or self.session_id),
+                    "drivers_saved": bool(self.team_id),
+                }
+            )
+        except Exception as exc:
+            log_exception(exc, 'Failed to save configuration', category='config_options', action='save_config')
+            self.save_failed.emit(str(exc))
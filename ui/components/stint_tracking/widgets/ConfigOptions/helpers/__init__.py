@@ -1,8 +1,10 @@
 from ._add_config_rows import _add_config_rows
 from ._apply_form_state import _apply_form_state
+from ._apply_saved_config import _apply_saved_config
 from ._can_switch_views import _can_switch_views
 from ._cancel_changes import _cancel_changes
 from ._capture_form_state import _capture_form_state
+from ._clear_save_worker import _clear_save_worker
 from ._clone_event import _clone_event
 from ._create_button_layout import _create_button_layout
 from ._create_buttons import _create_buttons
@@ -12,6 +14,7 @@ from ._handle_agent_registration_conflict import _handle_agent_registration_conf
 from ._handle_output import _handle_output
 from ._handle_process_error import _handle_process_error
 from ._handle_process_finished import _handle_process_finished
+from ._handle_save_failed import _handle_save_failed
 from ._handle_save_shortcut import _handle_save_shortcut
 from ._handle_stderr import _handle_stderr
 from ._handle_stdout import _handle_stdout
@@ -29,9 +32,11 @@ from ._toggle_track import _toggle_track
 __all__ = [
     '_add_config_rows',
     '_apply_form_state',
+    '_apply_saved_config',
     '_can_switch_views',
     '_cancel_changes',
     '_capture_form_state',
+    '_clear_save_worker',
     '_clone_event',
     '_create_button_layout',
     '_create_buttons',
@@ -41,6 +46,7 @@ __all__ = [
     '_handle_output',
     '_handle_process_error',
     '_handle_process_finished',
+    '_handle_save_failed',
     '_handle_save_shortcut',
     '_handle_stderr',
     '_handle_stdout',
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from core.errors import log
+
+
+def _apply_saved_config(self, result: dict) -> None:
+    """Commit the form state once the background save has finished."""
+    form_state = result["form_state"]
+    if result["drivers_saved"]:
+        self.drivers = form_state['drivers']
+
+    # Driver names don't feed the table; only reload for event/session edits
+    if result["reload_table"]:
+        self.table_model.update_data()
+
+    self._committed_form_state = form_state
+    # The form may have been edited again while the save was in flight
+    self._has_unsaved_form_changes = self._capture_form_state() != form_state
+    if not self._has_unsaved_form_changes:
+        self.save_btn.hide()
+        self.cancel_btn.hide()
+
+    log('INFO', 'Configuration saved successfully', category='config_options', action='save_config')
@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+
+def _clear_save_worker(self, worker: object | None = None) -> None:
+    """Forget the save worker after it finishes, unless a newer one replaced it."""
+    if worker is self._save_worker:
+        self._save_worker = None
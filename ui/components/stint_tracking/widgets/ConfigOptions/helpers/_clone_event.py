@@ -30,8 +30,9 @@ def _clone_event(self) -> None:
         new_session = get_session(str(session_result.inserted_id))
 
         if new_event and new_session:
-            self.selection_model.set_event(str(new_event['_id']), new_event['name'])
-            self.selection_model.set_session(str(new_session['_id']), new_session['name'])
+            with self.selection_model.batch():
+                self.selection_model.set_event(str(new_event['_id']), new_event['name'])
+                self.selection_model.set_session(str(new_session['_id']), new_session['name'])
 
         log('INFO', 'Event cloned successfully', category='config_options', action='clone_event')
     except Exception as e:
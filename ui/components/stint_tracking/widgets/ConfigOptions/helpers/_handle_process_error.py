@@ -13,3 +13,4 @@ def _handle_process_error(self, error) -> None:
     if self._tracking_active:
         self._revert_tracking_state()
         self.p = None
+        self.tracker_stopped.emit()
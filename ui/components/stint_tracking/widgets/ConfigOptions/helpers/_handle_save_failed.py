@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from ui.components.common import PopUp
+
+
+def _handle_save_failed(self, error: str) -> None:
+    """Tell the user a background save failed; the form stays dirty for a retry."""
+    dialog = PopUp(
+        title="Failed to save configuration",
+        message=f"The configuration could not be saved:\n{error}",
+        buttons=["Ok"],
+        type="error",
+        parent=self,
+    )
+    dialog.exec()
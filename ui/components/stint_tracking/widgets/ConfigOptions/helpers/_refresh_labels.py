@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from core.database import get_event, get_session, get_sessions, get_team
+from core.database import get_event, get_last_session, get_session, get_team
 from core.errors import log, log_exception
 
 
@@ -14,9 +14,8 @@ def _refresh_labels(self) -> None:
 
         self.session = get_session(self.selection_model.session_id)
         if not self.session:
-            sessions = list(get_sessions(self.event['_id']))
-            if sessions:
-                self.session = sessions[-1]
+            self.session = get_last_session(self.event['_id'])
+            if self.session:
                 self.selection_model.set_session(str(self.session['_id']), self.session['name'])
 
         self.team = get_team()
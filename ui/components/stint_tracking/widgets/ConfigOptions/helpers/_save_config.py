@@ -1,39 +1,50 @@
 from __future__ import annotations
 
-from core.database import update_event, update_session, update_team_drivers
 from core.errors import log, log_exception
 
+from ..ConfigSaveWorker import ConfigSaveWorker
+
 
 def _save_config(self) -> None:
-    """Persist event, session, and driver changes."""
+    """Persist event, session, and driver changes.
+
+    Only the documents whose fields differ from the committed form state
+    are written, and the writes run on a ``ConfigSaveWorker`` so the GUI
+    stays responsive for the database round trips.
+    """
+    if self._save_worker is not None and self._save_worker.isRunning():
+        log('INFO', 'Configuration save already in progress', category='config_options', action='save_config')
+        return
+
     try:
-        update_event(
-            str(self.selection_model.event_id),
-            name=self.inputs['event_name'].text(),
-            tires=self.inputs['tires'].text(),
-            length=self.inputs['length'].text(),
-            start_time=self.inputs['start_time'].text(),
+        form_state = self._capture_form_state()
+        committed = self._committed_form_state or {}
+        event_changed = any(
+            form_state[key] != committed.get(key)
+            for key in ('event_name', 'tires', 'length', 'start_time')
         )
-
-        update_session(
-            str(self.selection_model.session_id),
-            name=self.inputs['session_name'].text(),
-            tires_remaining_at_green_flag=int(self.inputs['tires_remaining_at_green_flag'].text()),
+        session_changed = any(
+            form_state[key] != committed.get(key)
+            for key in ('session_name', 'tires_remaining_at_green_flag')
         )
+        drivers_changed = bool(self.team) and form_state['drivers'] != committed.get('drivers')
 
-        drivers = [line_edit.text() for line_edit in self.driver_inputs]
-        if self.team:
-            update_team_drivers(str(self.team['_id']), drivers)
-            self.drivers = drivers
-
-        self.table_model.update_data()
-        self._committed_form_state = self._capture_form_state()
-        self._has_unsaved_form_changes = False
-        self.save_btn.hide()
-        self.cancel_btn.hide()
-
-        log('INFO', 'Configuration saved successfully', category='config_options', action='save_config')
-
-
+        # Validate on the GUI thread so bad input fails before any write
+        int(form_state['tires_remaining_at_green_flag'])
     except Exception as e:
         log_exception(e, 'Failed to save configuration', category='config_options', action='save_config')
+        return
+
+    worker = ConfigSaveWorker(
+        form_state,
+        event_id=str(self.selection_model.event_id) if event_changed else None,
+        session_id=str(self.selection_model.session_id) if session_changed else None,
+        team_id=str(self.team['_id']) if drivers_changed else None,
+        parent=self,
+    )
+    worker.save_ready.connect(self._apply_saved_config)
+    worker.save_failed.connect(self._handle_save_failed)
+    worker.finished.connect(lambda w=worker: self._clear_save_worker(w))
+    worker.finished.connect(worker.deleteLater)
+    self._save_worker = worker
+    worker.start()
@@ -38,15 +38,11 @@ def _start_process(self) -> None:
 
         self.agent_name = agent_name
 
-        self.p.start(program, process_args)
-        if not self.p.waitForStarted():
-            error_message = self.p.errorString()
-            log('ERROR', f'Failed to start stint tracker: {error_message}', category='config_options', action='start_process')
-            self._revert_tracking_state()
-            self.p = None
-            return
-
+        # Start asynchronously; launch failures arrive via errorOccurred
+        # instead of blocking the GUI thread in waitForStarted().
         self._tracking_active = True
-        log('INFO', f'Started stint tracker process: {program} {process_args}', category='config_options', action='start_process')
+        self.p.start(program, process_args)
+        if self._tracking_active:
+            log('INFO', f'Starting stint tracker process: {program} {process_args}', category='config_options', action='start_process')
     except Exception as e:
         log_exception(e, 'Failed to start stint tracker process', category='config_options', action='start_process')
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from PyQt6.QtWidgets import QLineEdit
-
 
 def _toggle_edit(self) -> None:
     """Toggle between view and edit modes."""
@@ -6,7 +6,7 @@ from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QHBoxLayout, QLabel, QVBoxLayout, QSizePolicy
 
 from ui.utilities import FONT, get_fonts
-from ui.utilities.load_icon import load_icon
+from ui.utilities.icon_cache import get_cached_icon
 
 
 def _setup_ui(self) -> None:
@@ -23,7 +23,7 @@ def _setup_ui(self) -> None:
 
     self.icon_label = QLabel(self)
     self.icon_label.setObjectName("StatsCardIcon")
-    icon_pixmap = load_icon(self.icon_path, size=14, color=self.icon_color)
+    icon_pixmap = get_cached_icon(self.icon_path, 14, self.icon_color)
     if not icon_pixmap.isNull():
         self.icon_label.setPixmap(icon_pixmap)
         self.icon_label.setFixedSize(icon_pixmap.size())
@@ -55,7 +55,7 @@ class StintTable(QWidget):
     _hide_placeholder = _hide_placeholder
     _set_column_widths = _set_column_widths
 
-    def __init__(self, models: ModelContainer, focus: bool = False, auto_update: bool = True, allow_editors: bool = False, enable_actions: bool = False):
+    def __init__(self, models: ModelContainer, focus: bool = False, auto_update: bool = True, allow_editors: bool = False, enable_actions: bool = False, refresh_editors: bool = True):
         super().__init__()
 
         self.selection_model = models.selection_model
@@ -94,12 +94,13 @@ class StintTable(QWidget):
         frame_layout.addWidget(self._placeholder_label, 1)
 
         if self.table_model is not None:
-            self.table_model.update_data()
-            self.refresh_table()
+            # The model is usually already populated for this selection
+            # (initial load or a tracker clone), so only reload when stale
+            self.refresh_table(skip_model_update=not self.table_model.needs_reload())
             self._setup_delegates()
             if allow_editors:
                 self._setup_editors()
-            else:
+            elif refresh_editors:
                 self.table_model.editorsNeedRefresh.connect(self._refresh_editors)
         else:
             log('WARNING', 'TableModel not available - table will be empty', category='stint_table', action='init')
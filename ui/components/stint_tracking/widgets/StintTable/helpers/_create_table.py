@@ -1,9 +1,8 @@
 from __future__ import annotations
 
 from PyQt6.QtCore import Qt
-from PyQt6.QtWidgets import QAbstractItemView, QHeaderView, QTableView, QSizePolicy
+from PyQt6.QtWidgets import QAbstractItemView, QTableView, QSizePolicy
 
-from ui.utilities import FONT, get_fonts
 from ....delegates import BackgroundRespectingDelegate
 from ....table import SpacedHeaderView
 from ....constants import VERTICAL_HEADER_WIDTH
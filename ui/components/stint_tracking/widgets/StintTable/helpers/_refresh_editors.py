@@ -3,15 +3,22 @@ from __future__ import annotations
 
 def _refresh_editors(self) -> None:
     """Refresh persistent editors for stint type column."""
-    if self.table.model() is None:
+    model = self.table.model()
+    if model is None:
         return
 
     self._hide_placeholder()
 
-    for row in range(self.table.model().rowCount()):
-        index = self.table.model().index(row, 0)
-        cell_text = str(index.data())
-        if cell_text:
-            self.table.openPersistentEditor(index)
+    table = self.table
+    for row in range(model.rowCount()):
+        index = model.index(row, 0)
+        wants_editor = bool(str(index.data()))
+        # Only touch rows whose editor state actually flips; resets already
+        # close every persistent editor, which isPersistentEditorOpen reflects
+        if wants_editor == table.isPersistentEditorOpen(index):
+            continue
+
+        if wants_editor:
+            table.openPersistentEditor(index)
         else:
-            self.table.closePersistentEditor(index)
+            table.closePersistentEditor(index)
@@ -4,14 +4,26 @@ from PyQt6.QtWidgets import QHeaderView
 
 from ....constants import COLUMN_WIDTHS
 
+# Resolved once; COLUMN_WIDTHS is static configuration
+_COLUMN_WIDTHS = tuple(COLUMN_WIDTHS.items())
+
 
 def _set_column_widths(self) -> None:
     """Apply fixed column widths and minimum table width."""
-    hh = self.table.horizontalHeader()
+    table = self.table
+    hh = table.horizontalHeader()
 
-    for col, width in COLUMN_WIDTHS.items():
-        hh.setSectionResizeMode(col, QHeaderView.ResizeMode.Fixed)
-        self.table.setColumnWidth(col, width)
+    # COLUMN_WIDTHS covers every column, so one global mode call replaces
+    # a per-section one; hold paints until all sections are sized.
+    updates_enabled = table.updatesEnabled()
+    table.setUpdatesEnabled(False)
+    try:
+        hh.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        for col, width in _COLUMN_WIDTHS:
+            hh.resizeSection(col, width)
+    finally:
+        # Callers may already be holding paints; leave that to them
+        table.setUpdatesEnabled(updates_enabled)
 
     hh.setSectionsMovable(False)
     hh.setCascadingSectionResizes(False)
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from ui.utilities import FONT, get_fonts
-
 
 def _setup_horizontal_header(self, table) -> None:
-    """Configure horizontal header font."""
+    """Configure horizontal header font and content sampling."""
     hh = table.horizontalHeader()
     font_table_header = self.font_table_header
     hh.setFont(font_table_header)
+    # Widths are fixed; if a section ever falls back to ResizeToContents,
+    # size it from the visible rows only instead of measuring every row
+    hh.setResizeContentsPrecision(0)
@@ -2,10 +2,7 @@ from __future__ import annotations
 
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFontMetrics
-from PyQt6.QtWidgets import QAbstractButton, QHBoxLayout, QLabel, QTableView, QWidget
-
-from ui.utilities import FONT, get_fonts, load_icon
-from ....constants import VERTICAL_HEADER_LABEL, VERTICAL_HEADER_WIDTH
+from PyQt6.QtWidgets import QHeaderView, QTableView
 
 
 def _setup_vertical_header(self, table: QTableView) -> None:
@@ -17,5 +14,8 @@ def _setup_vertical_header(self, table: QTableView) -> None:
     font_metrics = QFontMetrics(self.font_table_cell)
     row_height = font_metrics.height() + self.ROW_PADDING_VERTICAL
     vh.setDefaultSectionSize(row_height)
+    # Every row shares the default height; Fixed keeps it that way and
+    # drops the per-row resize handles the header would otherwise track
+    vh.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
 
     self._setup_corner_button(table, vh, self.font_table_header)
@@ -11,13 +11,17 @@ def refresh_table(self, skip_model_update: bool = False) -> None:
         return
 
     if isinstance(skip_model_update, str):
-        skip_model_update = False
+        # sessionChanged payload; another listener may already have loaded it
+        skip_model_update = not self.table_model.needs_reload()
 
     if not skip_model_update:
         LoadingQueue.push(MESSAGE)
+        # Hold paints until the model settles so the view repaints once
+        self.table.setUpdatesEnabled(False)
         try:
             self.table_model.update_data()
         finally:
+            self.table.setUpdatesEnabled(True)
             LoadingQueue.pop(MESSAGE)
 
     if self.table_model.rowCount() == 0:
@@ -25,13 +29,15 @@ def refresh_table(self, skip_model_update: bool = False) -> None:
     else:
         self._hide_placeholder()
 
-    if self.table.model():
-        column_count = self.table.model().columnCount()
-        if self._column_count != column_count:
-            self._set_column_widths()
-
-    if self.table.model() is None:
+    model = self.table.model()
+    if model is None:
         self.table.setModel(self.table_model)
-        if self.table.model() is not None:
-            self._column_count = self.table.model().columnCount()
-            self._set_column_widths()
+        self._column_count = self.table_model.columnCount()
+        self._set_column_widths()
+        return
+
+    # Only touch header section sizes when the column count really changed
+    column_count = model.columnCount()
+    if self._column_count != column_count:
+        self._column_count = column_count
+        self._set_column_widths()
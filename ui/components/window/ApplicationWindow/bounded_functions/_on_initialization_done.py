@@ -9,21 +9,11 @@ def _on_initialization_done(self, data, tires, mean_stint_time, events, sessions
 
     try:
         if hasattr(self, "navigation_menu") and hasattr(self.navigation_menu, "session_picker"):
-            session_picker = self.navigation_menu.session_picker
-            session_picker.events.blockSignals(True)
-            session_picker.sessions.blockSignals(True)
-            session_picker.events.clear()
-            for doc in events:
-                session_picker.events.addItem(doc.get("name", ""), userData=str(doc.get("_id", "")))
-            if events and sessions:
-                session_picker.sessions.clear()
-                for doc in sessions:
-                    session_picker.sessions.addItem(doc.get("name", ""), userData=str(doc.get("_id", "")))
-            session_picker.events.blockSignals(False)
-            session_picker.sessions.blockSignals(False)
-            session_picker.reload(
+            self.navigation_menu.session_picker.reload(
                 selected_event_id=self.selection_model.event_id,
                 selected_session_id=self.selection_model.session_id,
+                events=events,
+                sessions=sessions,
             )
     except Exception:
         pass
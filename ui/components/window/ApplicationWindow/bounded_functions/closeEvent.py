@@ -2,19 +2,31 @@
 
 from PyQt6.QtWidgets import QMainWindow
 
-from ui.components.stint_tracking import TrackerView
+from ui.components.stint_tracking import StrategiesView, TrackerView
 from core.errors import log_exception
 from PyQt6.QtGui import QCloseEvent
 
 
 def closeEvent(self, event: QCloseEvent) -> None:
-    """Ensure tracker shutdown runs when the app closes."""
+    """Ensure tracker shutdown and background saves and loads finish when the app closes."""
     try:
         tracker_view = self.navigation_model.widgets.get(TrackerView)
         if tracker_view is not None and tracker_view.config_options is not None:
-            tracker_view.config_options._shutdown_tracking()
+            config_options = tracker_view.config_options
+            config_options._shutdown_tracking()
+            if config_options._save_worker is not None:
+                # Let an in-flight save finish its writes before teardown
+                config_options._save_worker.wait()
     except Exception as exc:
         log_exception(exc, 'Exception during tracker shutdown',
             category='application_window', action='close_event')
 
+    try:
+        strategies_view = self.navigation_model.widgets.get(StrategiesView)
+        if strategies_view is not None:
+            strategies_view._shutdown_load_worker()
+    except Exception as exc:
+        log_exception(exc, 'Exception during strategies load shutdown',
+            category='application_window', action='close_event')
+
     QMainWindow.closeEvent(self, event)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from PyQt6.QtCore import QSize
 from PyQt6.QtWidgets import QWidget
 
 from .bounded_functions._create_button import _create_button
@@ -19,6 +20,10 @@ class WindowButtons(QWidget):
     BUTTON_CONTAINER_MARGIN_TOP = 8
     BUTTON_CONTAINER_MARGIN_RIGHT = 0
 
+    # Shared by every button instead of allocating two QSize per button
+    BUTTON_QSIZE = QSize(BUTTON_SIZE, BUTTON_SIZE)
+    BUTTON_ICON_QSIZE = QSize(BUTTON_ICON_SIZE, BUTTON_ICON_SIZE)
+
     BUTTON_ICONS = {
         "minimize": "resources/icons/window_buttons/minus.svg",
         "maximize": "resources/icons/window_buttons/square.svg",
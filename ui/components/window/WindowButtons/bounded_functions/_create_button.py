@@ -1,15 +1,20 @@
-from PyQt6.QtCore import QSize, Qt
+from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QIcon
 from PyQt6.QtWidgets import QToolButton
 
+# QIcons keyed by resolved path, shared across WindowButtons instances.
+_ICON_CACHE: dict[str, QIcon] = {}
+
 
 def _create_button(self, icon_path: str, callback) -> QToolButton:
     """Create a styled window control button."""
     button = QToolButton(self)
-    icon = QIcon(icon_path)
+    icon = _ICON_CACHE.get(icon_path)
+    if icon is None:
+        icon = _ICON_CACHE[icon_path] = QIcon(icon_path)
     button.setIcon(icon)
-    button.setIconSize(QSize(self.BUTTON_ICON_SIZE, self.BUTTON_ICON_SIZE))
+    button.setIconSize(self.BUTTON_ICON_QSIZE)
     button.clicked.connect(callback)
     button.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-    button.setFixedSize(QSize(self.BUTTON_SIZE, self.BUTTON_SIZE))
+    button.setFixedSize(self.BUTTON_QSIZE)
     return button
@@ -8,20 +8,21 @@ def _create_layout(self) -> None:
     layout = QHBoxLayout(self)
     layout.setContentsMargins(0, self.BUTTON_CONTAINER_MARGIN_TOP, self.BUTTON_CONTAINER_MARGIN_RIGHT, 0)
     layout.setSpacing(self.BUTTON_SPACING)
+    window = self.window()
 
     self.min_button = self._create_button(
         resource_path(self.BUTTON_ICONS["minimize"]),
-        self.window().showMinimized,
+        window.showMinimized,
     )
 
     self.max_button = self._create_button(
         resource_path(self.BUTTON_ICONS["maximize"]),
-        self.window().showMaximized,
+        window.showMaximized,
     )
 
     self.close_button = self._create_button(
         resource_path(self.BUTTON_ICONS["close"]),
-        self.window().close,
+        window.close,
     )
 
     self.restart_button = self._create_button(
@@ -33,7 +34,7 @@ def _create_layout(self) -> None:
 
     self.normal_button = self._create_button(
         resource_path(self.BUTTON_ICONS["restore"]),
-        self.window().showNormal,
+        window.showNormal,
     )
     self.normal_button.setVisible(False)
 
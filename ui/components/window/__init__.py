@@ -1,13 +1,19 @@
-"""Exports for window-level components and layout factories."""
+"""Exports for window-level components and layout factories.
 
-from .ApplicationWindow import ApplicationWindow
-from .WindowButtons import WindowButtons
-from .layout_factory import (
-    create_main_layout,
-    create_right_pane,
-    create_scroll_area,
-    create_stacked_container,
-)
+Exports resolve lazily (PEP 562) so importing one window submodule does
+not drag in ApplicationWindow and every view it composes.
+"""
+
+from importlib import import_module
+
+_LAZY_EXPORTS = {
+    "ApplicationWindow": ".ApplicationWindow",
+    "WindowButtons": ".WindowButtons",
+    "create_scroll_area": ".layout_factory",
+    "create_stacked_container": ".layout_factory",
+    "create_right_pane": ".layout_factory",
+    "create_main_layout": ".layout_factory",
+}
 
 __all__ = [
     "ApplicationWindow",
@@ -17,3 +23,14 @@ __all__ = [
     "create_right_pane",
     "create_main_layout",
 ]
+
+
+def __getattr__(name: str):
+    """Import an exported name on first access and cache it on the package."""
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
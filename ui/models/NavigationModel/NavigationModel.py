@@ -2,6 +2,7 @@ from PyQt6.QtCore import QObject, pyqtSignal
 
 from .bounded_functions._add_widget import _add_widget
 from .bounded_functions._set_active_widget import _set_active_widget
+from ..signal_batching import _emit, batch
 
 
 class NavigationModel(QObject):
@@ -13,11 +14,18 @@ class NavigationModel(QObject):
 
     _set_active_widget = _set_active_widget
     _add_widget = _add_widget
+    _emit = _emit
+    batch = batch
 
     def __init__(self):
         super().__init__()
         self._active_widget = None
         self._widgets = {}
+        self._batch_depth = 0
+        self._pending_signals = {}
+
+        # Forward at the Qt level instead of emitting the same payload twice.
+        self.activeWidgetChanged.connect(self.selectionChanged)
 
     @property
     def active_widget(self):
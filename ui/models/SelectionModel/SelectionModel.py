@@ -2,6 +2,7 @@ from PyQt6.QtCore import QObject, pyqtSignal
 
 from .bounded_functions._set_event import _set_event
 from .bounded_functions._set_session import _set_session
+from ..signal_batching import _emit, batch
 
 
 class SelectionModel(QObject):
@@ -13,6 +14,8 @@ class SelectionModel(QObject):
 
     _set_event = _set_event
     _set_session = _set_session
+    _emit = _emit
+    batch = batch
 
     def __init__(self):
         super().__init__()
@@ -20,6 +23,8 @@ class SelectionModel(QObject):
         self._session_id = None
         self._event_name = None
         self._session_name = None
+        self._batch_depth = 0
+        self._pending_signals = {}
 
     @property
     def event_id(self):
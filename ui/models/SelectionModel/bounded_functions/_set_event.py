@@ -3,5 +3,5 @@ def _set_event(self, event_id, event_name=""):
     if event_id != self._event_id:
         self._event_id = event_id
         self._event_name = event_name
-        self.eventChanged.emit(event_id, event_name)
-        self.selectionChanged.emit(self._event_id, self._session_id)
+        self._emit("eventChanged", event_id, event_name)
+        self._emit("selectionChanged", self._event_id, self._session_id)
@@ -3,5 +3,5 @@ def _set_session(self, session_id, session_name=""):
     if session_id != self._session_id:
         self._session_id = session_id
         self._session_name = session_name
-        self.sessionChanged.emit(session_id, session_name)
-        self.selectionChanged.emit(self._event_id, self._session_id)
+        self._emit("sessionChanged", session_id, session_name)
+        self._emit("selectionChanged", self._event_id, self._session_id)
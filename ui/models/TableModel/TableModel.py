@@ -2,16 +2,24 @@ from __future__ import annotations
 
 from PyQt6.QtCore import QAbstractTableModel, pyqtSignal
 
+from .bounded_functions._apply_rows import _apply_rows
 from .bounded_functions._assemble_header_data import headerData
+from .bounded_functions._batched_repaint import _batched_repaint
 from .bounded_functions._clone import clone
 from .bounded_functions._column_count import columnCount
 from .bounded_functions._data import data
 from .bounded_functions._delete_stint import delete_stint
+from .bounded_functions._emit_changed_rows import _emit_changed_rows
+from .bounded_functions._emit_data_changed import _emit_data_changed
+from .bounded_functions._emit_editors_refresh import _emit_editors_refresh
 from .bounded_functions._flags import flags
 from .bounded_functions._get_all_data import get_all_data
 from .bounded_functions._get_editable_flags import _get_editable_flags
+from .bounded_functions._get_event import _get_event
 from .bounded_functions._init_model import __init__
+from .bounded_functions._invalidate_event_cache import _invalidate_event_cache
 from .bounded_functions._load_data_from_database import _load_data_from_database
+from .bounded_functions._needs_reload import needs_reload
 from .bounded_functions._parse_pit_time import _parse_pit_time
 from .bounded_functions._recalculate_stint_types import _recalculate_stint_types
 from .bounded_functions._recalculate_tires_changed import _recalculate_tires_changed
@@ -20,6 +28,7 @@ from .bounded_functions._repaint_table import _repaint_table
 from .bounded_functions._row_count import rowCount
 from .bounded_functions._set_data import setData
 from .bounded_functions._set_editable import set_editable
+from .bounded_functions._sync_dimensions import _sync_dimensions
 from .bounded_functions._update_data import update_data
 from .bounded_functions._update_mean import update_mean
 
@@ -32,12 +41,21 @@ class TableModel(QAbstractTableModel):
     __init__ = __init__
     clone = clone
     update_data = update_data
+    needs_reload = needs_reload
     _load_data_from_database = _load_data_from_database
     _recalculate_tires_left = _recalculate_tires_left
     _recalculate_tires_changed = _recalculate_tires_changed
     _recalculate_stint_types = _recalculate_stint_types
     _repaint_table = _repaint_table
+    _emit_changed_rows = _emit_changed_rows
+    _apply_rows = _apply_rows
+    _sync_dimensions = _sync_dimensions
+    _emit_data_changed = _emit_data_changed
+    _emit_editors_refresh = _emit_editors_refresh
+    _batched_repaint = _batched_repaint
     update_mean = update_mean
+    _get_event = _get_event
+    _invalidate_event_cache = _invalidate_event_cache
     _parse_pit_time = _parse_pit_time
     set_editable = set_editable
     get_all_data = get_all_data
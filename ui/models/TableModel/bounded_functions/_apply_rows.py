@@ -0,0 +1,45 @@
+"""Swap in a new row set with the narrowest view notification possible."""
+
+from PyQt6.QtCore import QModelIndex
+
+
+def _apply_rows(self, data: list[list], tires: list[dict], meta: list[dict] = None) -> None:
+    """Replace rows, tires and (optionally) meta, notifying views structurally.
+
+    Row-count deltas become row insertions/removals at the tail and the
+    overlapping rows emit dataChanged only where they differ. A full reset
+    is reserved for column-count changes, or for callers that resized the
+    model's own list in place, since the view was never told about it.
+    """
+    old_data = self._data
+    old_tires = self._tires
+    old_meta = self._meta if meta is not None else None
+    old_count = self._row_count
+    new_count = len(data)
+    new_columns = len(data[0]) if data else 0
+
+    reset = new_columns != self._column_count or (data is old_data and new_count != old_count)
+
+    if reset:
+        self.beginResetModel()
+    elif new_count > old_count:
+        self.beginInsertRows(QModelIndex(), old_count, new_count - 1)
+    elif new_count < old_count:
+        self.beginRemoveRows(QModelIndex(), new_count, old_count - 1)
+
+    self._data = data
+    self._tires = tires
+    if meta is not None:
+        self._meta = meta
+    self._sync_dimensions()
+
+    if reset:
+        self.endResetModel()
+        return
+
+    if new_count > old_count:
+        self.endInsertRows()
+    elif new_count < old_count:
+        self.endRemoveRows()
+
+    self._emit_changed_rows(old_data, old_tires, old_meta)
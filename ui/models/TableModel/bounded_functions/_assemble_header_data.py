@@ -3,13 +3,17 @@
 from PyQt6.QtCore import Qt
 
 from ui.components.stint_tracking import get_header_icon
-from ui.utilities.load_icon import load_icon
+from ui.utilities.icon_cache import get_cached_icon
 from core.utilities import resource_path
 import os
 
 from ..constants import HEADER_ICON_COLOR, VERTICAL_HEADER_START_INDEX
 from core.errors.log_error.log import log
 
+_HEADER_ALIGNMENT = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+# Header icons ship with the app; stat each path once, not on every header paint
+_ICON_EXISTS: dict[str, bool] = {}
+
 
 def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):  # type: ignore[override]
     """Return header labels, icons, or alignment for the table.
@@ -41,26 +45,29 @@ def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.I
         if role == Qt.ItemDataRole.DecorationRole:
             icon_file = get_header_icon(section)
             rel_path = f"resources/icons/table_headers/{icon_file}"
-            abs_path = resource_path(rel_path)
-            if os.path.exists(abs_path):
+            icon_exists = _ICON_EXISTS.get(rel_path)
+            if icon_exists is None:
+                icon_exists = _ICON_EXISTS[rel_path] = os.path.exists(resource_path(rel_path))
+            if icon_exists:
                 # load_icon will resolve via resource_path itself, so give it
-                # the relative path to avoid double resolution
-                return load_icon(rel_path, color=HEADER_ICON_COLOR)
+                # the relative path to avoid double resolution; the cache keeps
+                # header repaints from re-rasterizing the SVG every time
+                return get_cached_icon(rel_path, 16, HEADER_ICON_COLOR)
             else:
                 log(
                     "WARNING",
-                    f"Icon file not found: {abs_path}",
+                    f"Icon file not found: {resource_path(rel_path)}",
                     category="ui",
                     action="load_icon",
                 )
                 return None
         if role == Qt.ItemDataRole.TextAlignmentRole:
-            return Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+            return _HEADER_ALIGNMENT
 
     elif orientation == Qt.Orientation.Vertical:
         if role == Qt.ItemDataRole.DisplayRole:
             return section + VERTICAL_HEADER_START_INDEX
         if role == Qt.ItemDataRole.TextAlignmentRole:
-            return Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+            return _HEADER_ALIGNMENT
 
     return None
@@ -0,0 +1,20 @@
+"""Coalesce dataChanged emissions across nested recalculations."""
+
+from contextlib import contextmanager
+
+
+@contextmanager
+def _batched_repaint(self):
+    """Suppress repaints inside the block and repaint once on outermost exit.
+
+    Editor refresh requests raised inside the block are coalesced the same way.
+    """
+    self._suppress_repaint += 1
+    try:
+        yield
+    finally:
+        self._suppress_repaint -= 1
+        if not self._suppress_repaint:
+            self._repaint_table()
+            if self._editors_refresh_pending:
+                self._emit_editors_refresh()
@@ -4,26 +4,29 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-import copy
-
+from ui.models.stint_helpers import copy_tire_data
 
 if TYPE_CHECKING:
     from ui.models.TableModel import TableModel
 
 
 def clone(self) -> TableModel:
-    """Create a deep copy of this model."""
+    """Create an independent copy of this model."""
 
     from ui.models.TableModel import TableModel as TableModelClass
 
+    # Headers and row cells are flat scalars, so shallow copies are enough;
+    # timedelta and int values are immutable and can be shared. Tires and
+    # meta have a fixed plain-dict shape, so skip deepcopy's generic walk.
     cloned_model = TableModelClass(
         selection_model=self.selection_model,
-        headers=copy.deepcopy(self.headers),
-        data=copy.deepcopy(self._data),
-        tires=copy.deepcopy(self._tires),
-        meta=copy.deepcopy(self._meta),
-        mean_stint_time=copy.deepcopy(self._mean_stint_time),
+        headers=list(self.headers),
+        data=[row[:] for row in self._data],
+        tires=[copy_tire_data(tire_data) for tire_data in self._tires],
+        meta=[dict(meta) if isinstance(meta, dict) else meta for meta in self._meta],
+        mean_stint_time=self._mean_stint_time,
     )
 
-    cloned_model._event_tire_count = copy.deepcopy(self._event_tire_count)
+    cloned_model._event_tire_count = self._event_tire_count
+    cloned_model._loaded_selection = self._loaded_selection
     return cloned_model
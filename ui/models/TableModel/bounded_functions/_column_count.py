@@ -3,6 +3,6 @@
 from PyQt6.QtCore import QModelIndex
 
 
-def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
-    """Return number of columns in model."""
-    return len(self._data[0]) if self._data else 0
+def columnCount(self, parent: QModelIndex = None) -> int:  # type: ignore[override]
+    """Return number of columns in model (cached; see ``_sync_dimensions``)."""
+    return self._column_count
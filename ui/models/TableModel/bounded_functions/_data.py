@@ -3,39 +3,56 @@
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QColor
 
-from ui.utilities import FONT, get_fonts
 from ui.models.TableRoles import TableRoles
 
+# Built once at import instead of on every paint of every cell.
+_CELL_ALIGNMENT = Qt.AlignmentFlag.AlignVCenter
+_EXCLUDED_BACKGROUND = QColor("#281F23")
+
+# Role members bound to module globals; data() compares against them per cell
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_BACKGROUND_ROLE = Qt.ItemDataRole.BackgroundRole
+_FONT_ROLE = Qt.ItemDataRole.FontRole
+_ALIGNMENT_ROLE = Qt.ItemDataRole.TextAlignmentRole
+_TIRES_ROLE = TableRoles.TiresRole
+_META_ROLE = TableRoles.MetaRole
+
 
 def data(self, index, role: int = Qt.ItemDataRole.DisplayRole):  # type: ignore[override]
     """Retrieve data for a specific cell and role."""
     if not index.isValid():
         return None
 
+    rows = self._data
     row = index.row()
-    col = index.column()
+    if row >= len(rows):
+        return None
 
-    if row >= len(self._data) or (self._data and col >= len(self._data[row])):
+    cells = rows[row]
+    col = index.column()
+    if col >= len(cells):
         return None
 
-    if role == Qt.ItemDataRole.DisplayRole:
-        return self._data[row][col]
+    # DisplayRole dominates view traffic, so it is answered first
+    if role == _DISPLAY_ROLE:
+        return cells[col]
 
-    if role == Qt.ItemDataRole.BackgroundRole:
-        meta = self._meta[row] if row < len(self._meta) else None
-        if isinstance(meta, dict) and meta.get("excluded"):
-            return QColor("#281F23")
+    if role == _ALIGNMENT_ROLE:
+        return _CELL_ALIGNMENT
 
-    if role == Qt.ItemDataRole.FontRole:
-        return get_fonts(FONT.text_ui)
+    if role == _FONT_ROLE:
+        return self._cell_font
 
-    if role == Qt.ItemDataRole.TextAlignmentRole:
-        return Qt.AlignmentFlag.AlignVCenter
+    if role == _BACKGROUND_ROLE:
+        meta = self._meta[row] if row < len(self._meta) else None
+        if isinstance(meta, dict) and meta.get("excluded"):
+            return _EXCLUDED_BACKGROUND
+        return None
 
-    if role == TableRoles.TiresRole:
+    if role == _TIRES_ROLE:
         return self._tires[row] if row < len(self._tires) else None
 
-    if role == TableRoles.MetaRole:
+    if role == _META_ROLE:
         return self._meta[row] if row < len(self._meta) else None
 
     return None
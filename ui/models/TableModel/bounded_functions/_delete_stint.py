@@ -73,6 +73,7 @@ def delete_stint(self, row: int, strategy_id: str = None) -> None:
                 action="delete_stint",
             )
     finally:
+        self._sync_dimensions()
         self.endResetModel()
 
     try:
@@ -0,0 +1,43 @@
+"""Emit dataChanged only for rows whose contents differ."""
+
+
+def _emit_changed_rows(self, old_data: list[list], old_tires: list[dict], old_meta: list[dict] = None) -> None:
+    """Emit one dataChanged per contiguous run of rows that differ from the previous snapshot.
+
+    Only rows present in both snapshots are compared; inserted rows are
+    announced by the caller's structural signals. ``old_meta`` is compared
+    too when given, since meta drives the excluded-row background.
+    """
+    column_count = self._column_count
+    if column_count == 0:
+        return
+
+    if old_data is self._data:
+        self._repaint_table()
+        return
+
+    data = self._data
+    tires = self._tires
+    meta = self._meta
+    last_column = column_count - 1
+    overlap = min(len(old_data), len(data))
+    run_start = None
+
+    for row in range(overlap):
+        old_tire = old_tires[row] if row < len(old_tires) else None
+        new_tire = tires[row] if row < len(tires) else None
+        same = old_data[row] == data[row] and old_tire == new_tire
+        if same and old_meta is not None:
+            same = (old_meta[row] if row < len(old_meta) else None) == (meta[row] if row < len(meta) else None)
+
+        if same:
+            if run_start is not None:
+                self.dataChanged.emit(self.index(run_start, 0), self.index(row - 1, last_column), [])
+                run_start = None
+            continue
+
+        if run_start is None:
+            run_start = row
+
+    if run_start is not None:
+        self.dataChanged.emit(self.index(run_start, 0), self.index(overlap - 1, last_column), [])
@@ -0,0 +1,9 @@
+"""Emit dataChanged unless a batched repaint is in progress."""
+
+
+def _emit_data_changed(self, top_left, bottom_right, roles: list = None) -> None:
+    """Emit dataChanged for a range, deferring to the batch flush if active."""
+    if self._suppress_repaint:
+        return
+
+    self.dataChanged.emit(top_left, bottom_right, roles or [])
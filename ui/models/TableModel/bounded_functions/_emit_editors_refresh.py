@@ -0,0 +1,11 @@
+"""Emit editorsNeedRefresh unless a batched repaint is in progress."""
+
+
+def _emit_editors_refresh(self) -> None:
+    """Request an editor refresh, deferring to the batch flush if active."""
+    if self._suppress_repaint:
+        self._editors_refresh_pending = True
+        return
+
+    self._editors_refresh_pending = False
+    self.editorsNeedRefresh.emit()
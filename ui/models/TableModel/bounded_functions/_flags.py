@@ -5,18 +5,22 @@ from PyQt6.QtCore import Qt
 from ui.models.table_constants import ColumnIndex
 from ui.models.table_utils import is_completed_row
 
+_EDITABLE_COLUMNS = frozenset((ColumnIndex.STINT_TYPE, ColumnIndex.TIRES_CHANGED))
+# Resolved once; most cells are read-only and return this on every query
+_NO_FLAGS = Qt.ItemFlag.NoItemFlags
+
 
 def flags(self, index):  # type: ignore[override]
     """Return item flags for a cell."""
     if not index.isValid():
-        return Qt.ItemFlag.NoItemFlags
+        return _NO_FLAGS
 
-    editable_columns = {ColumnIndex.STINT_TYPE, ColumnIndex.TIRES_CHANGED}
-    is_editable = self.editable and index.column() in editable_columns and (
+    # Cheap checks first: the row status scan only runs for editable columns
+    is_editable = self.editable and index.column() in _EDITABLE_COLUMNS and (
         not self.partial or is_completed_row(self._data, index.row())
     )
 
     if is_editable:
         return self._get_editable_flags()
 
-    return Qt.ItemFlag.NoItemFlags
+    return _NO_FLAGS
@@ -2,11 +2,13 @@
 
 from PyQt6.QtCore import Qt
 
+_EDITABLE_FLAGS = (
+    Qt.ItemFlag.ItemIsSelectable
+    | Qt.ItemFlag.ItemIsEnabled
+    | Qt.ItemFlag.ItemIsEditable
+)
+
 
 def _get_editable_flags(self) -> Qt.ItemFlags:
     """Return standard flags for editable cells."""
-    return (
-        Qt.ItemFlag.ItemIsSelectable
-        | Qt.ItemFlag.ItemIsEnabled
-        | Qt.ItemFlag.ItemIsEditable
-    )
+    return _EDITABLE_FLAGS
@@ -0,0 +1,15 @@
+"""Return the selected event document, cached per event id."""
+
+from core.database import get_event
+
+
+def _get_event(self) -> dict:
+    """Fetch the selected event once and serve repeat lookups from cache."""
+    event_id = self.selection_model.event_id
+    cached_id, cached_event = self._event_cache
+    if cached_event is not None and cached_id == event_id:
+        return cached_event
+
+    event = get_event(event_id)
+    self._event_cache = (event_id, event)
+    return event
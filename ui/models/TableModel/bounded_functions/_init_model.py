@@ -5,6 +5,8 @@ from __future__ import annotations
 from datetime import timedelta
 from PyQt6.QtCore import QAbstractTableModel
 
+from ui.utilities import FONT, get_fonts
+
 from ._load_data_from_database import _load_data_from_database
 
 
@@ -26,16 +28,28 @@ def __init__(
     self.editable = False
     self.partial = False
     self._event_tire_count = None
+    self._event_cache = (None, None)
+    self._suppress_repaint = 0
+    self._editors_refresh_pending = False
+    # (event_id, session_id) the rows were last loaded for; see needs_reload
+    self._loaded_selection = None
+    # get_fonts builds a fresh QFont per call; data() serves FontRole for every cell
+    self._cell_font = get_fonts(FONT.text_ui)
+
+    if selection_model is not None:
+        selection_model.eventChanged.connect(self._invalidate_event_cache)
 
     if data is not None:
         self._data = data
         self._tires = tires or []
         self._meta = meta or []
         self._mean_stint_time = mean_stint_time or timedelta(0)
+        self._sync_dimensions()
     else:
         self._data = []
         self._tires = []
         self._meta = []
         self._mean_stint_time = timedelta(0)
+        self._sync_dimensions()
         if load_on_init:
             _load_data_from_database(self)
@@ -0,0 +1,9 @@
+"""Drop the cached event document."""
+
+from PyQt6.QtCore import pyqtSlot
+
+
+@pyqtSlot(object, object)
+def _invalidate_event_cache(self, *_args) -> None:
+    """Forget the cached event so the next lookup hits the database."""
+    self._event_cache = (None, None)
@@ -19,10 +19,19 @@ def _load_data_from_database(self) -> None:
         action="load_data",
     )
 
+    # A database reload may follow event edits, so drop the cached event
+    # and reseed it from the document the payload builder just fetched.
+    self._invalidate_event_cache()
+
     payload = _build_table_data_payload(self.selection_model, self._parse_pit_time)
     if payload is None:
         return
 
+    self._loaded_selection = (self.selection_model.event_id, self.selection_model.session_id)
+
+    if payload["event"] is not None:
+        self._event_cache = (self.selection_model.event_id, payload["event"])
+
     total_tires = payload["total_tires"]
 
     try:
@@ -39,7 +48,7 @@ def _load_data_from_database(self) -> None:
     ]
 
     self._data = payload["rows"]
+    self._sync_dimensions()
     self._mean_stint_time = payload["mean_stint_time"]
 
     self._recalculate_stint_types()
-    self._repaint_table()
@@ -0,0 +1,15 @@
+"""Check whether the model still holds data for the current selection."""
+
+
+def needs_reload(self) -> bool:
+    """Return True when the loaded rows belong to a different event/session.
+
+    Strategy clones hold strategy rows rather than a database load of the
+    session's stints, so they never need a reload here.
+    """
+    if getattr(self, "_is_strategy", False):
+        return False
+    selection = self.selection_model
+    if selection is None:
+        return False
+    return self._loaded_selection != (selection.event_id, selection.session_id)
@@ -3,7 +3,13 @@
 
 def _repaint_table(self) -> None:
     """Emit dataChanged signal for entire table when dimensions unchanged."""
-    if self.rowCount() > 0 and self.columnCount() > 0:
+    if self._suppress_repaint:
+        return
+
+    # Cached dimensions avoid four rowCount/columnCount dispatches per repaint
+    row_count = self._row_count
+    column_count = self._column_count
+    if row_count > 0 and column_count > 0:
         top_left = self.index(0, 0)
-        bottom_right = self.index(self.rowCount() - 1, self.columnCount() - 1)
+        bottom_right = self.index(row_count - 1, column_count - 1)
         self.dataChanged.emit(top_left, bottom_right, [])
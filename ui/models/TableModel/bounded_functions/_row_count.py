@@ -4,7 +4,5 @@ from PyQt6.QtCore import QModelIndex
 
 
 def rowCount(self, parent: QModelIndex = None) -> int:  # type: ignore[override]
-    """Return number of rows in model."""
-    if parent is None:
-        parent = QModelIndex()
-    return len(self._data)
+    """Return number of rows in model (cached; see ``_sync_dimensions``)."""
+    return self._row_count
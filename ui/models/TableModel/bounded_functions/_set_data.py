@@ -15,9 +15,14 @@ def setData(self, index, value, role: int = Qt.ItemDataRole.EditRole):  # type:
     col = index.column()
 
     if role == Qt.ItemDataRole.EditRole:
+        # Editors commit on every focus change; skip the view roundtrip when nothing changed
+        if self._data[row][col] == value:
+            return True
         self._data[row][col] = value
 
     elif role == TableRoles.TiresRole:
+        if row < len(self._tires) and self._tires[row] == value:
+            return True
         while row >= len(self._tires):
             self._tires.append({})
         self._tires[row] = value
@@ -25,9 +30,11 @@ def setData(self, index, value, role: int = Qt.ItemDataRole.EditRole):  # type:
         self._data[row][ColumnIndex.TIRES_CHANGED] = str(tires_changed)
 
     elif role == TableRoles.MetaRole:
+        if row < len(self._meta) and self._meta[row] == value:
+            return True
         while row >= len(self._meta):
             self._meta.append({})
         self._meta[row] = value
 
-    self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole])
+    self._emit_data_changed(index, index, [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole])
     return True
@@ -0,0 +1,7 @@
+"""Refresh the cached row and column counts after structural changes."""
+
+
+def _sync_dimensions(self) -> None:
+    """Recompute cached dimensions; call whenever ``_data`` changes shape."""
+    self._row_count = len(self._data)
+    self._column_count = len(self._data[0]) if self._data else 0
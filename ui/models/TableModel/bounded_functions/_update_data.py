@@ -4,26 +4,36 @@ from datetime import timedelta
 
 
 def update_data(self, data: list[list] = None, tires: list[dict] = None, mean_stint_time: timedelta = None) -> None:
-    """Update model data and trigger view refresh."""
-    if data is not None:
-        existing_row_count = len(self._data)
-        new_row_count = len(data)
-
-        if existing_row_count == new_row_count:
-            self._data = data
-            self._tires = tires or []
-            self._mean_stint_time = mean_stint_time or timedelta(0)
-            self._repaint_table()
-            return
-
-    self.beginResetModel()
+    """Update model data and trigger view refresh.
 
+    Both explicit data and database reloads go through ``_apply_rows``, so
+    views see row insertions/removals plus dataChanged for rows that
+    actually differ; a reset is reserved for column-count changes.
+    """
     if data is not None:
-        self._data = data
-        self._tires = tires or []
         self._mean_stint_time = mean_stint_time or timedelta(0)
-        self._repaint_table()
+        # Explicit rows carry no meta, tire count or stint types, so they do
+        # not count as a database load for needs_reload()
+        self._apply_rows(data, tires or [])
     else:
-        self._load_data_from_database()
+        old_data, old_tires, old_meta = self._data, self._tires, self._meta
+
+        # Load into the model with view notifications muted, then put the
+        # previous snapshot back so _apply_rows can announce the difference
+        self._suppress_repaint += 1
+        try:
+            self._load_data_from_database()
+        finally:
+            self._suppress_repaint -= 1
+
+        if self._data is old_data:
+            # Nothing selected or nothing loaded; the model is unchanged
+            return
+
+        new_data, new_tires, new_meta = self._data, self._tires, self._meta
+        self._data, self._tires, self._meta = old_data, old_tires, old_meta
+        self._sync_dimensions()
+        self._apply_rows(new_data, new_tires, new_meta)
 
-    self.endResetModel()
+    if self._editors_refresh_pending:
+        self._emit_editors_refresh()
@@ -2,7 +2,6 @@
 
 from datetime import timedelta, datetime
 
-from core.database import get_event
 from core.errors import log_exception, log
 from ui.models.table_constants import ColumnIndex, NO_TIRE_CHANGE
 from ui.models.table_processors import generate_pending_stints
@@ -17,8 +16,10 @@ def update_mean(self, update_pending: bool = True) -> None:
         return
 
     self.beginResetModel()
+    # endResetModel already invalidates every view; mute the inner repaints
+    self._suppress_repaint += 1
     try:
-        event = get_event(self.selection_model.event_id)
+        event = self._get_event()
         race_length = event.get("length", DEFAULT_RACE_LENGTH) if event else DEFAULT_RACE_LENGTH
 
         completed_count = 0
@@ -68,6 +69,7 @@ def update_mean(self, update_pending: bool = True) -> None:
 
         self._data = self._data[:completed_count]
         self._tires = self._tires[:completed_count]
+        self._sync_dimensions()
 
         if update_pending:
             # sanitize previous time-of-day before handing to the processor
@@ -111,6 +113,7 @@ def update_mean(self, update_pending: bool = True) -> None:
                 prev_time_of_day,
                 prev_stint_time,
             )
+            self._sync_dimensions()
             last_tire_change = last_completed[ColumnIndex.TIRES_CHANGED]
             i = 0 if last_tire_change is NO_TIRE_CHANGE else 1
             while len(self._tires) < len(self._data):
@@ -124,4 +127,8 @@ def update_mean(self, update_pending: bool = True) -> None:
     except Exception as exc:  # pragma: no cover - defensive logging
         log_exception(exc, "Failed to update mean/pending rows", category="table_model", action="update_mean")
     finally:
+        self._suppress_repaint -= 1
+        self._sync_dimensions()
         self.endResetModel()
+        if self._editors_refresh_pending:
+            self._emit_editors_refresh()
@@ -6,9 +6,10 @@ with properly formatted string values (zero-padded HH:MM:SS) for time
 fields, plus integers and status strings.
 """
 
-from datetime import timedelta
+from ui.models.stint_helpers import format_seconds
 
-from ui.models.stint_helpers import format_timedelta
+# Indexed by bool(doc["status"]) instead of branching per row
+_STATUS_LABELS = ("Pending", "Completed")
 
 
 def mongo_docs_to_rows(docs: list[dict]) -> list[list]:
@@ -40,23 +41,19 @@ def mongo_docs_to_rows(docs: list[dict]) -> list[list]:
         >>> rows[0][7]  # time of day
         '00:00:00'
     """
-    rows = []
-
-    for doc in docs:
-        # convert stored seconds to formatted strings for display
-        stint_td = timedelta(seconds=int(doc.get("stint_time_seconds", 0)))
-        tod_td = timedelta(seconds=int(doc.get("time_of_day_seconds", 0)))
-        row = [
+    # Stored seconds are formatted directly; building a timedelta only to
+    # read total_seconds() back out again is wasted work per row.
+    return [
+        [
             doc.get("stint_type"),
             doc.get("name"),
-            "Completed" if doc.get("status") else "Pending",
+            _STATUS_LABELS[bool(doc.get("status"))],
             doc.get("pit_end_time"),
             int(doc.get("tires_changed", 0)),
             int(doc.get("tires_left", 0)),
-            format_timedelta(stint_td),
-            format_timedelta(tod_td),
-            "" # Placeholder for actions column
+            format_seconds(int(doc.get("stint_time_seconds", 0))),
+            format_seconds(int(doc.get("time_of_day_seconds", 0))),
+            "",  # Placeholder for actions column
         ]
-        rows.append(row)
-
-    return rows
+        for doc in docs
+    ]
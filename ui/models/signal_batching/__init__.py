@@ -0,0 +1,9 @@
+"""Signal batching helpers shared by the selection and navigation models."""
+
+from ._emit import _emit
+from .batch import batch
+
+__all__ = [
+    "_emit",
+    "batch",
+]
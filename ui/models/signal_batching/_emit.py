@@ -0,0 +1,10 @@
+"""Emit a model signal, or buffer it while a batch is open."""
+
+
+def _emit(self, signal_name: str, *args) -> None:
+    """Emit ``signal_name`` now, or store it (last one wins) during a batch."""
+    if self._batch_depth:
+        self._pending_signals[signal_name] = args
+        return
+
+    getattr(self, signal_name).emit(*args)
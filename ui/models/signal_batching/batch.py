@@ -0,0 +1,22 @@
+"""Context manager that coalesces model signal emissions."""
+
+from contextlib import contextmanager
+
+
+@contextmanager
+def batch(self):
+    """Buffer signals inside the block and emit each one once on exit.
+
+    Nested batches are allowed; only the outermost one flushes. Signals are
+    emitted in the order they were first raised, with their latest payload.
+    """
+    self._batch_depth += 1
+    try:
+        yield self
+    finally:
+        self._batch_depth -= 1
+        if not self._batch_depth:
+            pending = self._pending_signals
+            self._pending_signals = {}
+            for signal_name, args in pending.items():
+                getattr(self, signal_name).emit(*args)
@@ -3,9 +3,11 @@
 from .get_stint_type import get_stint_type
 from .get_stint_length import get_stint_length
 from .get_default_tire_dict import get_default_tire_dict
+from .copy_tire_data import copy_tire_data
 from .normalize_24h_time import normalize_24h_time
 from .calculate_stint_time import calculate_stint_time
 from .calculate_time_of_day import calculate_time_of_day
+from .format_seconds import format_seconds
 from .format_timedelta import format_timedelta
 from .calc_mean_stint_time import calc_mean_stint_time
 from .timedelta_to_time import timedelta_to_time
@@ -16,9 +18,11 @@ __all__ = [
     "get_stint_type",
     "get_stint_length",
     "get_default_tire_dict",
+    "copy_tire_data",
     "normalize_24h_time",
     "calculate_stint_time",
     "calculate_time_of_day",
+    "format_seconds",
     "format_timedelta",
     "calc_mean_stint_time",
     "timedelta_to_time",
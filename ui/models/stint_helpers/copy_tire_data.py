@@ -0,0 +1,20 @@
+"""Schema-aware copy of a stint's tire data."""
+
+
+def copy_tire_data(tire_data: dict) -> dict:
+    """Return an independent copy of tire data without going through deepcopy.
+
+    Tire data is at most three dict levels deep (position -> incoming/outgoing
+    -> scalar fields), so explicit comprehensions cover the whole structure.
+    """
+    if not isinstance(tire_data, dict):
+        return tire_data
+
+    return {
+        key: (
+            {inner_key: dict(inner) if isinstance(inner, dict) else inner for inner_key, inner in value.items()}
+            if isinstance(value, dict)
+            else value
+        )
+        for key, value in tire_data.items()
+    }
@@ -0,0 +1,8 @@
+"""Format a number of whole seconds as HH:MM:SS."""
+
+
+def format_seconds(total_seconds: int) -> str:
+    """Return a zero-padded HH:MM:SS string."""
+    hours, remainder = divmod(total_seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
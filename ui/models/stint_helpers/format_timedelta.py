@@ -2,11 +2,9 @@
 
 from datetime import timedelta
 
+from .format_seconds import format_seconds
+
 
 def format_timedelta(td: timedelta) -> str:
     """Return a zero-padded HH:MM:SS string."""
-    total_seconds = int(td.total_seconds())
-    hours = total_seconds // 3600
-    minutes = (total_seconds % 3600) // 60
-    seconds = total_seconds % 60
-    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+    return format_seconds(int(td.total_seconds()))
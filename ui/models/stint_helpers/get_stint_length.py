@@ -1,21 +1,13 @@
 """Convert stint type label to numeric length."""
 
+from ..table_constants import STINT_TYPE_NAMES
+
+_STINT_LENGTHS = {name: length for length, name in enumerate(STINT_TYPE_NAMES, start=1)}
+
 
 def get_stint_length(stint_type: str) -> int:
     """Return stint length (defaults to 1 when unknown)."""
     if not stint_type:
         return 1
 
-    mapping = {
-        "Single": 1,
-        "Double": 2,
-        "Triple": 3,
-        "Quadruple": 4,
-        "Quintuple": 5,
-        "Sextuple": 6,
-        "Septuple": 7,
-        "Octuple": 8,
-        "Nonuple": 9,
-        "Decuple": 10,
-    }
-    return mapping.get(stint_type, 1)
+    return _STINT_LENGTHS.get(stint_type, 1)
@@ -1,6 +1,6 @@
 """Barrel exports for table constants."""
 
-from .constants import ColumnIndex, TableRow, TireData, FULL_TIRE_SET, NO_TIRE_CHANGE
+from .constants import ColumnIndex, TableRow, TireData, FULL_TIRE_SET, NO_TIRE_CHANGE, STINT_TYPE_NAMES
 
 __all__ = [
     "ColumnIndex",
@@ -8,4 +8,5 @@ __all__ = [
     "TireData",
     "FULL_TIRE_SET",
     "NO_TIRE_CHANGE",
+    "STINT_TYPE_NAMES",
 ]
@@ -22,3 +22,18 @@ class ColumnIndex:
 
 FULL_TIRE_SET = 4
 NO_TIRE_CHANGE = 0
+
+
+# Stint type labels ordered by stint length (index 0 is a single stint).
+STINT_TYPE_NAMES = (
+    "Single",
+    "Double",
+    "Triple",
+    "Quadruple",
+    "Quintuple",
+    "Sextuple",
+    "Septuple",
+    "Octuple",
+    "Nonuple",
+    "Decuple",
+)
@@ -82,6 +82,7 @@ def _build_table_data_payload(
         index += 1
 
     return {
+        "event": event,
         "mean_stint_time": mean_stint_time if mean_stint_time is not None else timedelta(0),
         "rows": rows,
         "stints": stints,
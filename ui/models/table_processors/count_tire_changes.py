@@ -2,19 +2,31 @@
 
 from ..table_constants import TireData
 
+_TIRE_POSITIONS = ("fl", "fr", "rl", "rr")
+
+# Compound names arrive in mixed case ("Medium" from the tracker, "medium"
+# from the editor); classify each distinct spelling once instead of
+# lowercasing a fresh string per wheel per row.
+_IS_MEDIUM: dict[str, bool] = {}
+
 
 def count_tire_changes(tire_data: TireData) -> tuple[int, int]:
     """Return counts of total and medium-compound tire changes."""
     total_changed = 0
     medium_changed = 0
+    changed_flags = tire_data.get("tires_changed", {})
 
-    for tire in ["fl", "fr", "rl", "rr"]:
-        is_changed = tire_data.get("tires_changed", {}).get(tire, False)
-        compound = tire_data.get(tire, {}).get("outgoing", {}).get("compound", "").lower()
+    for tire in _TIRE_POSITIONS:
+        if not changed_flags.get(tire, False):
+            continue
 
-        if is_changed:
-            total_changed += 1
-            if compound == "medium":
-                medium_changed += 1
+        total_changed += 1
+        # Only changed tires need their compound inspected
+        compound = tire_data.get(tire, {}).get("outgoing", {}).get("compound", "")
+        is_medium = _IS_MEDIUM.get(compound)
+        if is_medium is None:
+            is_medium = _IS_MEDIUM[compound] = str(compound).lower() == "medium"
+        if is_medium:
+            medium_changed += 1
 
     return total_changed, medium_changed
@@ -1,8 +1,5 @@
 """Recalculate stint types across the table."""
 
-from PyQt6.QtCore import Qt
-
-from ..TableRoles import TableRoles
 from ..stint_helpers import get_stint_type
 from ..table_constants import ColumnIndex
 from ._calculate_stint_type_with_tire_change import _calculate_stint_type_with_tire_change
@@ -10,37 +7,36 @@ from ._calculate_stint_type_with_tire_change import _calculate_stint_type_with_t
 
 def recalculate_stint_types(
     data: list[list],
-    index_fn,
-    row_count_fn,
     emit_editors_refresh,
-    emit_data_changed,
-    repaint_table,
 ) -> None:
-    """Refresh stint types in response to tire-change edits."""
+    """Refresh stint types in response to tire-change edits.
+
+    View notification is left to the caller, which emits a single range
+    update once every recalculation in the batch has run.
+    """
     if not data:
         return
 
+    # Alias enum members and helpers to locals; this loop runs on every tire edit
+    tires_col = ColumnIndex.TIRES_CHANGED
+    type_col = ColumnIndex.STINT_TYPE
+    stint_type_for = get_stint_type
+    type_with_tire_change = _calculate_stint_type_with_tire_change
     start_of_stint = 0
 
     for i, row in enumerate(data):
-        tires_changed = int(row[ColumnIndex.TIRES_CHANGED])
+        tires_changed = int(row[tires_col])
         stint_amounts = i - start_of_stint
 
         if tires_changed:
-            stint_type = _calculate_stint_type_with_tire_change(data, start_of_stint, i, stint_amounts)
+            stint_type = type_with_tire_change(data, start_of_stint, i, stint_amounts)
             start_of_stint = i + 1
-        elif stint_amounts and not tires_changed:
-            data[start_of_stint][ColumnIndex.STINT_TYPE] = get_stint_type(stint_amounts)
+        elif stint_amounts:
+            data[start_of_stint][type_col] = stint_type_for(stint_amounts)
             stint_type = ""
         else:
-            stint_type = get_stint_type(stint_amounts)
+            stint_type = stint_type_for(stint_amounts)
 
-        row[ColumnIndex.STINT_TYPE] = stint_type
+        row[type_col] = stint_type
 
     emit_editors_refresh()
-    emit_data_changed(
-        index_fn(0, 0),
-        index_fn(row_count_fn() - 1, ColumnIndex.STINT_TIME),
-        [Qt.ItemDataRole.DisplayRole, TableRoles.TiresRole],
-    )
-    repaint_table()
@@ -1,7 +1,5 @@
 """Redistribute tire changes after a stint-type edit."""
 
-import copy
-
 from ..stint_helpers import get_default_tire_dict, get_stint_length
 from ..table_constants import ColumnIndex, FULL_TIRE_SET, NO_TIRE_CHANGE
 
@@ -22,42 +20,38 @@ def recalculate_tires_changed(
     new_len = get_stint_length(data[row][ColumnIndex.STINT_TYPE])
     delta = new_len - old_len
 
-    old_tire_changes = []
-
-    for i in range(total_rows):
-        if int(data[i][ColumnIndex.TIRES_CHANGED]) > 0:
-            old_tire_changes.append(
-                {
-                    "row": i,
-                    "value": data[i][ColumnIndex.TIRES_CHANGED],
-                    "tires": copy.deepcopy(tires[i]),
-                }
-            )
-
-    for r in range(total_rows):
-        data[r][ColumnIndex.TIRES_CHANGED] = str(NO_TIRE_CHANGE)
-        tires[r] = get_default_tire_dict(False)
-
     new_tire_positions = {}
+    vacated_rows = []
 
-    for record in old_tire_changes:
-        old_row = record["row"]
+    # Rows above the edited stint never move, so only the tail is spliced.
+    # The saved tire dicts are moved, never mutated, so no copy is needed.
+    for old_row in range(row, total_rows):
+        value = data[old_row][ColumnIndex.TIRES_CHANGED]
+        if int(value) <= 0:
+            continue
 
-        if row <= old_row < row + old_len:
+        vacated_rows.append(old_row)
+        if old_row < row + old_len:
             new_row = min(row + new_len - 1, total_rows - 1)
-        elif old_row >= row + old_len:
-            new_row = old_row + delta
         else:
-            new_row = old_row
+            new_row = old_row + delta
 
         if 0 <= new_row < total_rows:
-            new_tire_positions[new_row] = record
-
-    for new_row, record in new_tire_positions.items():
-        data[new_row][ColumnIndex.TIRES_CHANGED] = record["value"]
-        tires[new_row] = record["tires"]
+            new_tire_positions[new_row] = (value, tires[old_row])
 
     forced_row = min(row + new_len - 1, total_rows - 1)
+
+    # Only rows that lose a change are reset; untouched rows keep their dicts
+    for r in vacated_rows:
+        if r != forced_row and r not in new_tire_positions:
+            data[r][ColumnIndex.TIRES_CHANGED] = str(NO_TIRE_CHANGE)
+            tires[r] = get_default_tire_dict(False)
+
+    for r, (value, tire_data) in new_tire_positions.items():
+        if r != forced_row:
+            data[r][ColumnIndex.TIRES_CHANGED] = value
+            tires[r] = tire_data
+
     data[forced_row][ColumnIndex.TIRES_CHANGED] = str(FULL_TIRE_SET)
     tires[forced_row] = get_default_tire_dict(True)
 
@@ -1,5 +1,7 @@
 """Recalculate remaining tires for each row."""
 
+from itertools import accumulate
+
 from core.errors import log
 
 from ..table_constants import ColumnIndex
@@ -22,13 +24,15 @@ def recalculate_tires_left(
         )
         return
 
-    tires_left = int(total_tires)
+    # Work column-wise: build the per-row medium-change lane, run one
+    # cumulative pass over it, then write the tires-left column back.
+    medium_changes = [count_tire_changes(tire_data)[1] for tire_data in tires[:len(data)]]
+    medium_changes.extend([0] * (len(data) - len(medium_changes)))
 
-    for i, row in enumerate(data):
-        if i < len(tires):
-            _, medium_changed = count_tire_changes(tires[i])
-            tires_left -= medium_changed
+    used = accumulate(medium_changes)
+    remaining = int(total_tires)
 
-        row[ColumnIndex.TIRES_LEFT] = str(tires_left)
+    for row, used_so_far in zip(data, used):
+        row[ColumnIndex.TIRES_LEFT] = str(remaining - used_so_far)
 
     recalc_stint_types_fn()
@@ -1,4 +1,4 @@
-from ui.models.table_constants import ColumnIndex, TableRow
+from ui.models.table_constants import TableRow
 
 
 def create_table_row(
@@ -1,3 +1,6 @@
 """Shared font state for the fonts utility."""
 
 font_family: str | None = None
+
+# Configured QFont per typography; get_fonts hands out copies of these
+font_cache: dict = {}
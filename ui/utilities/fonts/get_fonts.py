@@ -8,16 +8,23 @@ from ui.utilities.fonts.helpers._load_fonts import _load_fonts
 
 
 def get_fonts(typography: FONT) -> QFont:
-    """Return a configured QFont for the given typography enum."""
-    _load_fonts()
+    """Return a configured QFont for the given typography enum.
 
-    font_settings = typography.value
-    font = QFont(_state.font_family)
-    font.setPointSizeF(font_settings["point_size"])
-    font.setWeight(font_settings["weight"])
-    font.setHintingPreference(QFont.HintingPreference.PreferNoHinting)
-    font.setStyleStrategy(
-        QFont.StyleStrategy.PreferAntialias | QFont.StyleStrategy.NoSubpixelAntialias
-    )
+    Each typography is configured once; callers receive a copy, which Qt
+    shares implicitly, so mutating the result never leaks into the cache.
+    """
+    font = _state.font_cache.get(typography)
+    if font is None:
+        _load_fonts()
 
-    return font
+        font_settings = typography.value
+        font = QFont(_state.font_family)
+        font.setPointSizeF(font_settings["point_size"])
+        font.setWeight(font_settings["weight"])
+        font.setHintingPreference(QFont.HintingPreference.PreferNoHinting)
+        font.setStyleStrategy(
+            QFont.StyleStrategy.PreferAntialias | QFont.StyleStrategy.NoSubpixelAntialias
+        )
+        _state.font_cache[typography] = font
+
+    return QFont(font)
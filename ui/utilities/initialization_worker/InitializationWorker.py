@@ -39,14 +39,15 @@ class InitializationWorker(QThread):
 
             LoadingQueue.push(_MSG_NAV)
             try:
+                # The prefetch only feeds the session picker, which needs _id and name
                 try:
-                    events = list(get_events(sort_by=None))
+                    events = get_events(sort_by=None, projection={"name": 1})
                 except Exception:
                     events = []
                 sessions = []
                 if events:
                     try:
-                        sessions = list(get_sessions(str(events[0].get("_id")), sort_by=None))
+                        sessions = get_sessions(str(events[0].get("_id")), sort_by=None, projection={"name": 1})
                     except Exception:
                         sessions = []
             finally:
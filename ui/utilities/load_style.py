@@ -4,10 +4,16 @@ The public function `load_style` takes a single argument `file_name` which
 is the resource-relative path to the stylesheet (for example:
 `resources/styles/common/config_button.qss`). When logging, the `file_name` is
 used as the `category` with `/` replaced by `-`.
+
+Stylesheet contents are cached per path for the life of the process, so
+widgets that are rebuilt often (cards, popups) don't re-read their QSS
+from disk on every construction.
 """
 from core.utilities import resource_path
 from core.errors import log, log_exception
 
+_STYLE_CACHE: dict[str, str] = {}
+
 
 def load_style(file_name: str, widget=None) -> str:
     """Return the stylesheet contents; optionally apply it to `widget`.
@@ -17,13 +23,16 @@ def load_style(file_name: str, widget=None) -> str:
     `file_name` is used as the logging category with `/` replaced by
     `-`.
     """
-    try:
-        with open(resource_path(file_name), 'r', encoding='utf-8') as f:
-            style = f.read()
-    except FileNotFoundError:
-        category = file_name.replace('/', '-')
-        log('WARNING', f'{file_name} stylesheet not found', category=category, action='load_stylesheet')
-        return ""
+    style = _STYLE_CACHE.get(file_name)
+    if style is None:
+        try:
+            with open(resource_path(file_name), 'r', encoding='utf-8') as f:
+                style = f.read()
+        except FileNotFoundError:
+            category = file_name.replace('/', '-')
+            log('WARNING', f'{file_name} stylesheet not found', category=category, action='load_stylesheet')
+            return ""
+        _STYLE_CACHE[file_name] = style
 
     if widget and style:
         try: